@@ -7,20 +7,45 @@ with environment variables taking precedence.
 
 import os
 import re
-import yaml
+import json
+import sys
+import pickle
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, field
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from itertools import repeat
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Project root (job-application-agent/); __file__ is src/config.py
+_BASE_PATH = Path(__file__).resolve().parent.parent
+_DEFAULT_CONFIG_PATH = _BASE_PATH / "config" / "config.yaml"
 
-@dataclass
+# Matches ${VAR_NAME} references in config values
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Read-only defaults shared by every config instance
+_DEFAULT_KEYWORDS = ("development economics", "research")
+_DEFAULT_LOCATIONS = ("Remote", "Global")
+_DEFAULT_SCRAPERS = ("reliefweb", "devex")
+
+# Set in os.environ once the .env file has been loaded. Child processes
+# inherit it (and the loaded variables), so they skip re-reading .env.
+_DOTENV_MARKER = "_DOTENV_LOADED"
+
+
+@dataclass(frozen=True, slots=True)
 class ProfileConfig:
     """Profile/CV configuration."""
     local_path: str = "index.html"
@@ -28,35 +53,42 @@ class ProfileConfig:
     cache_file: str = "data/profile_cache.json"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobSearchConfig:
     """Job search configuration."""
-    keywords: list = field(default_factory=lambda: ["development economics", "research"])
-    locations: list = field(default_factory=lambda: ["Remote", "Global"])
+    keywords: tuple = _DEFAULT_KEYWORDS
+    locations: tuple = _DEFAULT_LOCATIONS
     match_threshold: int = 70
     max_jobs_per_run: int = 50
+    top_k: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScrapersConfig:
     """Scrapers configuration."""
-    enabled: list = field(default_factory=lambda: ["reliefweb", "devex"])
+    enabled: tuple = _DEFAULT_SCRAPERS
     rate_limit_seconds: int = 2
     timeout_seconds: int = 30
     max_retries: int = 3
     rotate_user_agent: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GeminiConfig:
     """Gemini API configuration."""
     model: str = "gemini-2.5-flash"
     temperature: float = 0.7
     max_tokens: int = 4096
     safety_threshold: str = "BLOCK_ONLY_HIGH"
+    max_concurrency: int = 8
+    requests_per_minute: int = 60
+    match_batch_size: int = 5
+    match_cache_ttl_days: int = 7
+    semantic_cache_model: str = ""
+    semantic_cache_threshold: float = 0.95
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmailConfig:
     """Email notification configuration."""
     recipient: str = ""
@@ -67,14 +99,14 @@ class EmailConfig:
     subject_template: str = "Job Matches Found - {date} ({count} jobs)"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database configuration."""
     path: str = "data/jobs.db"
     retention_days: int = 90
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -83,13 +115,68 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OutputConfig:
     """Output paths configuration."""
     cover_letters_dir: str = "output/cover_letters"
     logs_dir: str = "logs"
 
 
+# Section defaults that differ from the dataclass defaults
+_SECTION_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "gemini": {"model": "gemini-2.0-flash-exp"},
+    "email": {"recipient": "${EMAIL_ADDRESS}"},
+}
+
+# Fields whose values may contain ${VAR_NAME} references
+_ENV_RESOLVED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "profile": ("local_path",),
+    "email": ("recipient",),
+}
+
+# Environment variables that take precedence over the YAML value
+_ENV_OVERRIDES: Dict[str, Dict[str, str]] = {
+    "database": {"path": "DATABASE_PATH"},
+    "logging": {"level": "LOG_LEVEL"},
+}
+
+
+def _intern_keys(tree: Any) -> Any:
+    """
+    Return a copy of a parsed config tree with all string dict keys interned.
+    
+    Keys such as "enabled" or "base_url" repeat across sections; interning
+    lets them share one object and makes later lookups identity-fast.
+    """
+    root = [None]
+    stack = [(root, 0, tree)]
+    while stack:
+        parent, key, node = stack.pop()
+        if isinstance(node, dict):
+            copy = {
+                (sys.intern(k) if isinstance(k, str) else k): None
+                for k in node
+            }
+            parent[key] = copy
+            stack.extend(zip(repeat(copy), copy, node.values()))
+        elif isinstance(node, list):
+            copy = [None] * len(node)
+            parent[key] = copy
+            stack.extend((copy, i, item) for i, item in enumerate(node))
+        else:
+            parent[key] = node
+    return root[0]
+
+
+def _resolve_env_string(value: str) -> str:
+    """Substitute ${VAR_NAME} references in a single string."""
+    # Most values carry no references; skip the regex for those
+    if "${" not in value:
+        return value
+    # Substitute all ${VAR_NAME} patterns in a single pass
+    return _ENV_VAR_RE.sub(lambda m: os.environ.get(m.group(1), ""), value)
+
+
 class Config:
     """
     Main configuration class that loads and manages all settings.
@@ -107,36 +194,71 @@ class Config:
         Args:
             config_path: Path to YAML config file. If None, uses default location.
         """
-        # base_path is the project root (job-application-agent/)
-        # __file__ is src/config.py, so .parent.parent gets us to project root
-        self.base_path = Path(__file__).parent.parent
+        if not os.environ.get(_DOTENV_MARKER):
+            # Load environment variables from .env file
+            from dotenv import load_dotenv
+            load_dotenv()
+            os.environ[_DOTENV_MARKER] = "1"
+        
+        self.base_path = _BASE_PATH
         
         if config_path is None:
-            config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
+            config_path = os.environ.get("CONFIG_PATH")
         
-        self.config_path = self.base_path / config_path
-        self._raw_config: Dict[str, Any] = {}
-        self._scraper_configs: Dict[str, Dict[str, Any]] = {}
+        if config_path is None:
+            self.config_path = _DEFAULT_CONFIG_PATH
+        else:
+            self.config_path = self.base_path / config_path
+        self._raw_config: Mapping[str, Any] = _EMPTY_MAPPING
+        self._scraper_configs: Mapping[str, Mapping[str, Any]] = _EMPTY_MAPPING
         
         # Load configuration
         self._load_config()
+        self.refresh_env()
         
-        # Initialize config objects
-        self.profile = self._load_profile_config()
-        self.job_search = self._load_job_search_config()
-        self.scrapers = self._load_scrapers_config()
-        self.gemini = self._load_gemini_config()
-        self.email = self._load_email_config()
-        self.database = self._load_database_config()
-        self.logging = self._load_logging_config()
-        self.output = self._load_output_config()
+        # Scrapers look up their settings repeatedly; memoize per name
+        self.get_scraper_config = lru_cache(maxsize=None)(self.get_scraper_config)
+    
+    # Config sections are built (and their ${VAR} references resolved)
+    # on first access, so sections a caller never reads cost nothing.
+    
+    @cached_property
+    def profile(self) -> ProfileConfig:
+        return self._load_section("profile", ProfileConfig)
+    
+    @cached_property
+    def job_search(self) -> JobSearchConfig:
+        return self._load_section("job_search", JobSearchConfig)
+    
+    @cached_property
+    def scrapers(self) -> ScrapersConfig:
+        return self._load_section("scrapers", ScrapersConfig)
+    
+    @cached_property
+    def gemini(self) -> GeminiConfig:
+        return self._load_section("gemini", GeminiConfig)
+    
+    @cached_property
+    def email(self) -> EmailConfig:
+        return self._load_section("email", EmailConfig)
+    
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        return self._load_section("database", DatabaseConfig)
+    
+    @cached_property
+    def logging(self) -> LoggingConfig:
+        return self._load_section("logging", LoggingConfig)
+    
+    @cached_property
+    def output(self) -> OutputConfig:
+        return self._load_section("output", OutputConfig)
     
     def _load_config(self) -> None:
         """Load configuration from YAML file."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    self._raw_config = yaml.safe_load(f) or {}
+                self._raw_config = _intern_keys(self._read_config_file())
                 logger.info(f"Loaded configuration from {self.config_path}")
             except Exception as e:
                 logger.warning(f"Failed to load config file: {e}. Using defaults.")
@@ -146,29 +268,102 @@ class Config:
             self._raw_config = {}
         
         # Load scraper-specific configs
-        self._scraper_configs = self._raw_config.get("scraper_configs", {})
+        scraper_configs = self._raw_config.get("scraper_configs") or {}
+        
+        # Both are read-only after loading; expose them as proxies so they
+        # can be handed out without defensive copies
+        self._raw_config = MappingProxyType(self._raw_config)
+        self._scraper_configs = MappingProxyType({
+            name: MappingProxyType(settings or {})
+            for name, settings in scraper_configs.items()
+        })
+    
+    def _read_config_file(self) -> Dict[str, Any]:
+        """
+        Parse the YAML config file, reusing a pre-parsed copy when possible.
+        
+        A JSON export next to the YAML file (see export_json) is used when
+        it is at least as new as the YAML. Otherwise the parsed config is
+        cached in a hidden pickle sidecar keyed by the YAML file's mtime and
+        size, so unchanged configs skip YAML parsing on later runs.
+        """
+        stat = self.config_path.stat()
+        
+        json_path = self.config_path.with_suffix(".json")
+        try:
+            if json_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+                with open(json_path, "rb") as f:
+                    return _json_loads(f.read())
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid config JSON {json_path}: {e}")
+        
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cache_path = self.config_path.with_name(f".{self.config_path.name}.cache")
+        
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, raw_config = pickle.load(f)
+            if cached_key == cache_key:
+                return raw_config
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+        
+        import yaml
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        # Binary mode lets the libyaml loader decode UTF-8 itself
+        with open(self.config_path, "rb") as f:
+            raw_config = yaml.load(f, Loader=loader) or {}
+        
+        # Write atomically so a concurrent reader never sees a partial cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((cache_key, raw_config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write config cache {cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        
+        return raw_config
     
     def _resolve_env_vars(self, value: Any) -> Any:
         """
         Resolve environment variable references in config values.
         
-        Supports ${VAR_NAME} syntax.
+        Supports ${VAR_NAME} syntax. Nested dicts and lists are walked with
+        an explicit stack and copied, so the raw config is never modified.
         """
         if isinstance(value, str):
-            # Find all ${VAR_NAME} patterns
-            pattern = r'\$\{([^}]+)\}'
-            matches = re.findall(pattern, value)
-            
-            for var_name in matches:
-                env_value = os.environ.get(var_name, "")
-                value = value.replace(f"${{{var_name}}}", env_value)
-            
+            return _resolve_env_string(value)
+        if not isinstance(value, (dict, list)):
             return value
-        elif isinstance(value, dict):
-            return {k: self._resolve_env_vars(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._resolve_env_vars(item) for item in value]
-        return value
+        
+        root = [None]
+        stack = [(root, 0, value)]
+        while stack:
+            parent, key, node = stack.pop()
+            if isinstance(node, str):
+                parent[key] = _resolve_env_string(node)
+            elif isinstance(node, dict):
+                # Pre-seed the keys so the copy keeps the original ordering
+                copy = dict.fromkeys(node)
+                parent[key] = copy
+                stack.extend((copy, k, v) for k, v in node.items())
+            elif isinstance(node, list):
+                copy = [None] * len(node)
+                parent[key] = copy
+                stack.extend((copy, i, item) for i, item in enumerate(node))
+            else:
+                parent[key] = node
+        return root[0]
     
     def _get_config_value(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value with environment variable resolution."""
@@ -176,88 +371,51 @@ class Config:
         value = section_config.get(key, default)
         return self._resolve_env_vars(value)
     
-    def _load_profile_config(self) -> ProfileConfig:
-        """Load profile configuration."""
-        section = self._raw_config.get("profile", {})
-        return ProfileConfig(
-            local_path=self._resolve_env_vars(section.get("local_path", "index.html")),
-            cache_duration_hours=section.get("cache_duration_hours", 24),
-            cache_file=section.get("cache_file", "data/profile_cache.json")
-        )
-    
-    def _load_job_search_config(self) -> JobSearchConfig:
-        """Load job search configuration."""
-        section = self._raw_config.get("job_search", {})
-        return JobSearchConfig(
-            keywords=section.get("keywords", ["development economics", "research"]),
-            locations=section.get("locations", ["Remote", "Global"]),
-            match_threshold=section.get("match_threshold", 70),
-            max_jobs_per_run=section.get("max_jobs_per_run", 50)
-        )
-    
-    def _load_scrapers_config(self) -> ScrapersConfig:
-        """Load scrapers configuration."""
-        section = self._raw_config.get("scrapers", {})
-        return ScrapersConfig(
-            enabled=section.get("enabled", ["reliefweb", "devex"]),
-            rate_limit_seconds=section.get("rate_limit_seconds", 2),
-            timeout_seconds=section.get("timeout_seconds", 30),
-            max_retries=section.get("max_retries", 3),
-            rotate_user_agent=section.get("rotate_user_agent", True)
-        )
-    
-    def _load_gemini_config(self) -> GeminiConfig:
-        """Load Gemini API configuration."""
-        section = self._raw_config.get("gemini", {})
-        return GeminiConfig(
-            model=section.get("model", "gemini-2.0-flash-exp"),
-            temperature=section.get("temperature", 0.7),
-            max_tokens=section.get("max_tokens", 4096),
-            safety_threshold=section.get("safety_threshold", "BLOCK_ONLY_HIGH")
-        )
-    
-    def _load_email_config(self) -> EmailConfig:
-        """Load email configuration."""
-        section = self._raw_config.get("email", {})
-        recipient = self._resolve_env_vars(section.get("recipient", "${EMAIL_ADDRESS}"))
-        return EmailConfig(
-            recipient=recipient,
-            send_summary=section.get("send_summary", True),
-            attach_cover_letter=section.get("attach_cover_letter", True),
-            attach_cv=section.get("attach_cv", True),
-            cv_path=section.get("cv_path", "data/cv.pdf"),
-            subject_template=section.get("subject_template", "Job Matches Found - {date} ({count} jobs)")
-        )
-    
-    def _load_database_config(self) -> DatabaseConfig:
-        """Load database configuration."""
-        section = self._raw_config.get("database", {})
-        path = os.environ.get("DATABASE_PATH", section.get("path", "data/jobs.db"))
-        return DatabaseConfig(
-            path=path,
-            retention_days=section.get("retention_days", 90)
-        )
-    
-    def _load_logging_config(self) -> LoggingConfig:
-        """Load logging configuration."""
-        section = self._raw_config.get("logging", {})
-        level = os.environ.get("LOG_LEVEL", section.get("level", "INFO"))
-        return LoggingConfig(
-            level=level,
-            file=section.get("file", "logs/job_agent.log"),
-            max_size_mb=section.get("max_size_mb", 10),
-            backup_count=section.get("backup_count", 5)
-        )
+    def _load_section(self, name: str, section_cls: type) -> Any:
+        """
+        Build a config section dataclass from its YAML section.
+        
+        Keys missing from the YAML fall back to the dataclass defaults
+        (or the overrides in _SECTION_DEFAULTS). Fields listed in
+        _ENV_RESOLVED_FIELDS get ${VAR} substitution, and _ENV_OVERRIDES
+        lets environment variables replace individual values.
+        """
+        section = self._raw_config.get(name) or {}
+        values = {**_SECTION_DEFAULTS.get(name, {}), **section}
+        
+        kwargs = {}
+        for f in fields(section_cls):
+            if f.name in values:
+                value = values[f.name]
+                kwargs[f.name] = tuple(value) if f.type is tuple else value
+        
+        for key in _ENV_RESOLVED_FIELDS.get(name, ()):
+            if key in kwargs:
+                kwargs[key] = self._resolve_env_vars(kwargs[key])
+        
+        for key, env_var in _ENV_OVERRIDES.get(name, {}).items():
+            if env_var in os.environ:
+                kwargs[key] = os.environ[env_var]
+        
+        return section_cls(**kwargs)
     
-    def _load_output_config(self) -> OutputConfig:
-        """Load output paths configuration."""
-        section = self._raw_config.get("output", {})
-        return OutputConfig(
-            cover_letters_dir=section.get("cover_letters_dir", "output/cover_letters"),
-            logs_dir=section.get("logs_dir", "logs")
-        )
+    def export_json(self, json_path: Optional[Path] = None) -> Path:
+        """
+        Write the parsed YAML config as JSON for faster loading.
+        
+        Args:
+            json_path: Output path. Defaults to the YAML path with a .json suffix.
+            
+        Returns:
+            Path the JSON file was written to
+        """
+        json_path = Path(json_path) if json_path else self.config_path.with_suffix(".json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(dict(self._raw_config), f, indent=2, ensure_ascii=False)
+        logger.info(f"Exported configuration to {json_path}")
+        return json_path
     
-    def get_scraper_config(self, scraper_name: str) -> Dict[str, Any]:
+    def get_scraper_config(self, scraper_name: str) -> Mapping[str, Any]:
         """
         Get configuration for a specific scraper.
         
@@ -265,40 +423,65 @@ class Config:
             scraper_name: Name of the scraper (e.g., 'reliefweb', 'devex')
             
         Returns:
-            Dictionary with scraper-specific configuration
+            Read-only mapping with scraper-specific configuration
         """
-        return self._scraper_configs.get(scraper_name, {})
+        return self._scraper_configs.get(scraper_name, _EMPTY_MAPPING)
+    
+    def refresh_env(self) -> None:
+        """
+        Re-read environment-derived settings.
+        
+        The API key, dry-run and cache flags are captured at construction;
+        call this if the environment is changed afterwards.
+        """
+        self._api_key = os.environ.get("GEMINI_API_KEY", "")
+        self._dry_run = os.environ.get("DRY_RUN", "false").lower() == "true"
+        self._cache_enabled = os.environ.get("CACHE_ENABLED", "true").lower() == "true"
     
     def get_api_key(self) -> str:
         """Get Gemini API key from environment."""
-        api_key = os.environ.get("GEMINI_API_KEY", "")
-        if not api_key:
+        if not self._api_key:
             logger.warning("GEMINI_API_KEY not set in environment")
-        return api_key
+        return self._api_key
     
     def is_dry_run(self) -> bool:
         """Check if running in dry run mode (no emails sent)."""
-        return os.environ.get("DRY_RUN", "false").lower() == "true"
+        return self._dry_run
+    
+    def is_cache_enabled(self) -> bool:
+        """Check if Gemini match scores may be reused from the database."""
+        return self._cache_enabled
     
     def get_absolute_path(self, relative_path: str) -> Path:
         """Convert a relative path to absolute path based on project root."""
         return self.base_path / relative_path
     
+    @cached_property
+    def _managed_dirs(self) -> Tuple[Path, ...]:
+        """Absolute paths of the directories the agent writes into."""
+        return (
+            self.base_path / self.output.cover_letters_dir,
+            self.base_path / self.output.logs_dir,
+            self.base_path / "data",
+        )
+    
     def ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        directories = [
-            self.get_absolute_path(self.output.cover_letters_dir),
-            self.get_absolute_path(self.output.logs_dir),
-            self.get_absolute_path("data"),
-        ]
-        
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {directory}")
+        for directory in self._managed_dirs:
+            # On re-runs the directories usually exist already; try the
+            # cheap single mkdir first and only walk parents when needed.
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                os.makedirs(directory, exist_ok=True)
+        logger.debug(f"Ensured directories exist: {', '.join(map(str, self._managed_dirs))}")
 
 
 # Global config instance (lazy loaded)
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config(config_path: Optional[str] = None) -> Config:
@@ -312,9 +495,15 @@ def get_config(config_path: Optional[str] = None) -> Config:
         Config instance
     """
     global _config
-    if _config is None:
-        _config = Config(config_path)
-    return _config
+    config = _config
+    if config is not None:
+        return config
+    
+    # Double-checked so concurrent first callers build only one Config
+    with _config_lock:
+        if _config is None:
+            _config = Config(config_path)
+        return _config
 
 
 def reload_config(config_path: Optional[str] = None) -> Config:
@@ -328,5 +517,7 @@ def reload_config(config_path: Optional[str] = None) -> Config:
         New Config instance
     """
     global _config
-    _config = Config(config_path)
-    return _config
+    config = Config(config_path)
+    with _config_lock:
+        _config = config
+    return config
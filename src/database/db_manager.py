@@ -8,16 +8,233 @@ application status, and generated cover letters.
 import sqlite3
 import logging
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Set, Tuple
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Applied once when the connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
 
-@dataclass
+# SQL used by DatabaseManager methods. Keeping each statement as one
+# module-level string lets sqlite3's per-connection statement cache hit
+# on every call instead of re-preparing the query.
+_SQL_INSERT_JOB = """
+    INSERT OR IGNORE INTO jobs (
+        job_id, url, title, organization, location, description,
+        posted_date, deadline, requirements, application_url,
+        source, raw_data, scraped_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_JOB_EXISTS = "SELECT 1 FROM jobs WHERE job_id = ?"
+
+_SQL_JOB_PROCESSED = "SELECT 1 FROM processed_jobs WHERE job_id = ?"
+
+# Templates for batched membership lookups; {placeholders} is filled with
+# at most _MAX_SQL_PARAMS "?" markers (SQLite's historic parameter limit)
+_MAX_SQL_PARAMS = 999
+
+_SQL_EXISTING_JOB_IDS = "SELECT job_id FROM jobs WHERE job_id IN ({placeholders})"
+
+_SQL_PROCESSED_JOB_IDS = "SELECT job_id FROM processed_jobs WHERE job_id IN ({placeholders})"
+
+# Job columns in Job field order so rows can be passed positionally
+_JOB_COLUMNS = """
+    job_id, url, title, organization, location, description,
+    posted_date, deadline, requirements, application_url, source, raw_data
+"""
+
+# Rows fetched per fetchmany() call when streaming results
+_FETCH_BATCH_SIZE = 64
+
+_SQL_UNPROCESSED_JOBS_BY_SOURCE = f"""
+    SELECT {_JOB_COLUMNS} FROM jobs j
+    WHERE j.source = ?
+    AND NOT EXISTS (SELECT 1 FROM processed_jobs p WHERE p.job_id = j.job_id)
+    ORDER BY j.scraped_date DESC
+    LIMIT ?
+"""
+
+_SQL_UNPROCESSED_JOBS = f"""
+    SELECT {_JOB_COLUMNS} FROM jobs j
+    WHERE NOT EXISTS (SELECT 1 FROM processed_jobs p WHERE p.job_id = j.job_id)
+    ORDER BY j.scraped_date DESC
+    LIMIT ?
+"""
+
+_SQL_CREATE_PROCESSED_JOBS = """
+    CREATE TABLE IF NOT EXISTS processed_jobs (
+        job_id TEXT PRIMARY KEY,
+        match_score REAL NOT NULL,
+        processed_date TEXT NOT NULL,
+        cover_letter_path TEXT,
+        application_status TEXT DEFAULT 'pending',
+        notes TEXT,
+        FOREIGN KEY (job_id) REFERENCES jobs(job_id)
+    )
+"""
+
+# Upserts update the existing row in place; re-marking a job keeps its
+# application_status
+_SQL_MARK_PROCESSED = """
+    INSERT INTO processed_jobs (
+        job_id, match_score, processed_date, cover_letter_path,
+        application_status, notes
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(job_id) DO UPDATE SET
+        match_score = excluded.match_score,
+        processed_date = excluded.processed_date,
+        cover_letter_path = excluded.cover_letter_path,
+        notes = excluded.notes
+"""
+
+_SQL_SAVE_MATCH_RESULT = """
+    INSERT INTO match_results (
+        job_id, match_score, skills_match, experience_match,
+        research_match, qualification_match, reasoning, matched_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(job_id) DO UPDATE SET
+        match_score = excluded.match_score,
+        skills_match = excluded.skills_match,
+        experience_match = excluded.experience_match,
+        research_match = excluded.research_match,
+        qualification_match = excluded.qualification_match,
+        reasoning = excluded.reasoning,
+        matched_date = excluded.matched_date
+"""
+
+_SQL_SAVE_COVER_LETTER = """
+    INSERT INTO cover_letters (job_id, content, file_path, generated_date)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Processed-job columns in ProcessedJob field order, with job details
+# joined in from the jobs table
+_PROCESSED_JOB_COLUMNS = """
+    p.job_id, j.url, j.title, j.organization, j.source, p.match_score,
+    p.processed_date, p.cover_letter_path, p.application_status, p.notes
+"""
+
+_SQL_LATEST_COVER_LETTER = """
+    SELECT content, file_path FROM cover_letters
+    WHERE job_id = ?
+    ORDER BY generated_date DESC, id DESC
+    LIMIT 1
+"""
+
+_SQL_MATCHED_JOBS = f"""
+    SELECT {_PROCESSED_JOB_COLUMNS}
+    FROM processed_jobs p JOIN jobs j ON j.job_id = p.job_id
+    WHERE p.match_score >= ?
+    ORDER BY p.match_score DESC, p.processed_date DESC
+    LIMIT ?
+"""
+
+_SQL_MATCHED_JOBS_SINCE = f"""
+    SELECT {_PROCESSED_JOB_COLUMNS}
+    FROM processed_jobs p JOIN jobs j ON j.job_id = p.job_id
+    WHERE p.match_score >= ? AND p.processed_date >= ?
+    ORDER BY p.match_score DESC, p.processed_date DESC
+    LIMIT ?
+"""
+
+_SQL_GET_JOB = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id = ?"
+
+_SQL_GET_MATCH_RESULT = "SELECT * FROM match_results WHERE job_id = ?"
+
+# Empty or missing notes (bound as NULL) leave the stored notes unchanged
+_SQL_UPDATE_STATUS = """
+    UPDATE processed_jobs
+    SET application_status = ?, notes = COALESCE(?, notes)
+    WHERE job_id = ?
+"""
+
+_SQL_GET_CACHED_MATCH = """
+    SELECT score_json FROM match_cache
+    WHERE cache_key = ? AND created_at >= ?
+"""
+
+_SQL_CACHE_MATCH = """
+    INSERT INTO match_cache (cache_key, score_json, created_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(cache_key) DO UPDATE SET
+        score_json = excluded.score_json,
+        created_at = excluded.created_at
+"""
+
+_SQL_SAVE_MATCH_EMBEDDING = """
+    INSERT INTO match_embeddings (cache_key, context_key, embedding, created_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(cache_key) DO UPDATE SET
+        context_key = excluded.context_key,
+        embedding = excluded.embedding,
+        created_at = excluded.created_at
+"""
+
+_SQL_MATCH_EMBEDDINGS = """
+    SELECT cache_key, embedding FROM match_embeddings
+    WHERE context_key = ? AND created_at >= ?
+"""
+
+_SQL_JOBS_BY_SOURCE = "SELECT source, COUNT(*) FROM jobs GROUP BY source"
+
+# One pass over processed_jobs: per-status counts plus the pieces needed
+# to derive the overall average and above-threshold count
+_SQL_PROCESSED_SUMMARY = """
+    SELECT
+        application_status,
+        COUNT(*),
+        SUM(match_score),
+        COUNT(match_score),
+        SUM(CASE WHEN match_score >= 70 THEN 1 ELSE 0 END)
+    FROM processed_jobs
+    GROUP BY application_status
+"""
+
+_SQL_DELETE_OLD_COVER_LETTERS = """
+    DELETE FROM cover_letters
+    WHERE generated_date < ?
+"""
+
+_SQL_DELETE_OLD_MATCH_RESULTS = """
+    DELETE FROM match_results
+    WHERE matched_date < ?
+"""
+
+_SQL_DELETE_OLD_MATCH_CACHE = """
+    DELETE FROM match_cache
+    WHERE created_at < ?
+"""
+
+_SQL_DELETE_OLD_MATCH_EMBEDDINGS = """
+    DELETE FROM match_embeddings
+    WHERE created_at < ?
+"""
+
+_SQL_DELETE_OLD_PROCESSED = """
+    DELETE FROM processed_jobs
+    WHERE processed_date < ?
+"""
+
+_SQL_DELETE_OLD_JOBS = """
+    DELETE FROM jobs
+    WHERE scraped_date < ?
+    AND NOT EXISTS (SELECT 1 FROM processed_jobs p WHERE p.job_id = jobs.job_id)
+"""
+
+
+@dataclass(frozen=True, slots=True)
 class Job:
     """Represents a job posting."""
     job_id: str
@@ -37,10 +254,22 @@ class Job:
     def generate_id(cls, url: str, title: str, organization: str) -> str:
         """Generate a unique job ID from URL, title, and organization."""
         content = f"{url}|{title}|{organization}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # BLAKE2b skips OpenSSL's per-call setup; a 16-byte digest keeps
+        # IDs the same length as the previous MD5 hex digests
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 
-@dataclass
+def _job_row(job: Job, scraped_date: str) -> tuple:
+    """Parameters for _SQL_INSERT_JOB, in column order."""
+    return (
+        job.job_id, job.url, job.title, job.organization,
+        job.location, job.description, job.posted_date,
+        job.deadline, job.requirements, job.application_url,
+        job.source, job.raw_data, scraped_date
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class ProcessedJob:
     """Represents a processed job record."""
     job_id: str
@@ -55,7 +284,7 @@ class ProcessedJob:
     notes: Optional[str] = None
 
 
-@dataclass 
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     """Represents a job match result."""
     job_id: str
@@ -77,6 +306,9 @@ class DatabaseManager:
     - processed_jobs: Jobs that have been matched and processed
     - match_results: Detailed match scores for jobs
     - cover_letters: Generated cover letters
+    - match_cache: Gemini match scores keyed by job/profile content hash
+    - match_embeddings: Job embeddings pointing into match_cache, for
+      reusing scores of near-duplicate postings
     """
     
     def __init__(self, db_path: str = "data/jobs.db"):
@@ -88,21 +320,33 @@ class DatabaseManager:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # One long-lived connection shared by all methods; the lock
+        # serializes access when the manager is used from several threads.
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        self.conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+        
         self._init_database()
     
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        """
+        Context manager for a database transaction.
+        
+        Commits on success and rolls back if the block raises.
+        """
+        with self._lock, self.conn:
+            yield self.conn
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
     
     def _init_database(self) -> None:
         """Initialize database tables."""
@@ -129,22 +373,10 @@ class DatabaseManager:
                 )
             """)
             
-            # Processed jobs table - jobs that have been matched
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS processed_jobs (
-                    job_id TEXT PRIMARY KEY,
-                    url TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    organization TEXT NOT NULL,
-                    source TEXT NOT NULL,
-                    match_score REAL NOT NULL,
-                    processed_date TEXT NOT NULL,
-                    cover_letter_path TEXT,
-                    application_status TEXT DEFAULT 'pending',
-                    notes TEXT,
-                    FOREIGN KEY (job_id) REFERENCES jobs(job_id)
-                )
-            """)
+            # Processed jobs table - jobs that have been matched. Job details
+            # (url, title, ...) are read from the jobs table, not copied here.
+            self._migrate_processed_jobs(cursor)
+            cursor.execute(_SQL_CREATE_PROCESSED_JOBS)
             
             # Match results table - detailed match scores
             cursor.execute("""
@@ -173,14 +405,83 @@ class DatabaseManager:
                 )
             """)
             
-            # Create indexes for common queries
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs(scraped_date)")
+            # Match cache - scores reused for unchanged job/profile content
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS match_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    score_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            
+            # Match embeddings - see src/matching/semantic_cache.py
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS match_embeddings (
+                    cache_key TEXT PRIMARY KEY,
+                    context_key TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            
+            # Create indexes for common queries. The (scraped_date, job_id)
+            # and (source, scraped_date) pairs let get_unprocessed_jobs walk
+            # jobs newest-first without a sort step.
+            cursor.execute("DROP INDEX IF EXISTS idx_jobs_source")
+            cursor.execute("DROP INDEX IF EXISTS idx_jobs_scraped_date")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped_desc ON jobs(scraped_date DESC, job_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source_scraped ON jobs(source, scraped_date DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_jobs_date ON processed_jobs(processed_date)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_jobs_score ON processed_jobs(match_score)")
+            # (match_score, processed_date) matches get_matched_jobs' range and
+            # ORDER BY, so it can stop after LIMIT rows without sorting
+            cursor.execute("DROP INDEX IF EXISTS idx_processed_jobs_score")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_jobs_score_date ON processed_jobs(match_score DESC, processed_date DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_match_results_date ON match_results(matched_date)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_cover_letters_date ON cover_letters(generated_date)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_cover_letters_job ON cover_letters(job_id, generated_date DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_match_embeddings_context ON match_embeddings(context_key, created_at)")
+            
+            # Refresh planner statistics so the indexes above get used
+            cursor.execute("ANALYZE")
             
             logger.info(f"Database initialized at {self.db_path}")
     
+    def _migrate_processed_jobs(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Rebuild a processed_jobs table that still carries copied job columns.
+        
+        Rows whose job is missing from the jobs table are first copied back
+        into it so the join in get_matched_jobs still finds them.
+        """
+        cursor.execute("PRAGMA table_info(processed_jobs)")
+        columns = {row["name"] for row in cursor.fetchall()}
+        if "url" not in columns:
+            return
+        
+        logger.info("Migrating processed_jobs to the normalized schema")
+        cursor.execute("""
+            INSERT OR IGNORE INTO jobs (
+                job_id, url, title, organization, source, scraped_date
+            )
+            SELECT job_id, url, title, organization, source, processed_date
+            FROM processed_jobs
+        """)
+        cursor.execute("DROP INDEX IF EXISTS idx_processed_jobs_date")
+        cursor.execute("DROP INDEX IF EXISTS idx_processed_jobs_score")
+        cursor.execute("DROP INDEX IF EXISTS idx_processed_jobs_score_date")
+        cursor.execute("ALTER TABLE processed_jobs RENAME TO processed_jobs_old")
+        cursor.execute(_SQL_CREATE_PROCESSED_JOBS)
+        cursor.execute("""
+            INSERT INTO processed_jobs (
+                job_id, match_score, processed_date, cover_letter_path,
+                application_status, notes
+            )
+            SELECT job_id, match_score, processed_date, cover_letter_path,
+                   application_status, notes
+            FROM processed_jobs_old
+        """)
+        cursor.execute("DROP TABLE processed_jobs_old")
+    
     def add_job(self, job: Job) -> bool:
         """
         Add a job to the database.
@@ -193,24 +494,17 @@ class DatabaseManager:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            try:
-                cursor.execute("""
-                    INSERT INTO jobs (
-                        job_id, url, title, organization, location, description,
-                        posted_date, deadline, requirements, application_url,
-                        source, raw_data, scraped_date
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    job.job_id, job.url, job.title, job.organization,
-                    job.location, job.description, job.posted_date,
-                    job.deadline, job.requirements, job.application_url,
-                    job.source, job.raw_data, datetime.now().isoformat()
-                ))
+            cursor.execute(_SQL_INSERT_JOB, (
+                job.job_id, job.url, job.title, job.organization,
+                job.location, job.description, job.posted_date,
+                job.deadline, job.requirements, job.application_url,
+                job.source, job.raw_data, datetime.now().isoformat()
+            ))
+            if cursor.rowcount == 1:
                 logger.debug(f"Added job: {job.title} at {job.organization}")
                 return True
-            except sqlite3.IntegrityError:
-                logger.debug(f"Job already exists: {job.title} at {job.organization}")
-                return False
+            logger.debug(f"Job already exists: {job.title} at {job.organization}")
+            return False
     
     def add_jobs(self, jobs: List[Job]) -> int:
         """
@@ -222,10 +516,16 @@ class DatabaseManager:
         Returns:
             Number of jobs successfully added
         """
-        added = 0
-        for job in jobs:
-            if self.add_job(job):
-                added += 1
+        scraped_date = datetime.now().isoformat()
+        rows = [_job_row(job, scraped_date) for job in jobs]
+        
+        # One transaction for the whole batch; duplicates are skipped by
+        # the conflict clause instead of raising per row
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_SQL_INSERT_JOB, rows)
+            added = max(cursor.rowcount, 0)
+        
         logger.info(f"Added {added}/{len(jobs)} jobs to database")
         return added
     
@@ -233,16 +533,54 @@ class DatabaseManager:
         """Check if a job already exists in the database."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,))
+            cursor.execute(_SQL_JOB_EXISTS, (job_id,))
             return cursor.fetchone() is not None
     
     def is_job_processed(self, job_id: str) -> bool:
         """Check if a job has already been processed (matched)."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM processed_jobs WHERE job_id = ?", (job_id,))
+            cursor.execute(_SQL_JOB_PROCESSED, (job_id,))
             return cursor.fetchone() is not None
     
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Return the subset of job IDs that already exist in the database.
+        
+        Args:
+            ids: Job IDs to look up
+            
+        Returns:
+            Set of IDs present in the jobs table
+        """
+        return self._select_ids(_SQL_EXISTING_JOB_IDS, ids)
+    
+    def processed_ids(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Return the subset of job IDs that have already been processed.
+        
+        Args:
+            ids: Job IDs to look up
+            
+        Returns:
+            Set of IDs present in the processed_jobs table
+        """
+        return self._select_ids(_SQL_PROCESSED_JOB_IDS, ids)
+    
+    def _select_ids(self, template: str, ids: Iterable[str]) -> Set[str]:
+        """Run a batched IN (...) lookup, chunked to stay under the parameter limit."""
+        ids = list(dict.fromkeys(ids))
+        found: Set[str] = set()
+        if not ids:
+            return found
+        
+        with self._get_connection() as conn:
+            for start in range(0, len(ids), _MAX_SQL_PARAMS):
+                chunk = ids[start:start + _MAX_SQL_PARAMS]
+                query = template.format(placeholders=",".join("?" * len(chunk)))
+                found.update(row[0] for row in conn.execute(query, chunk))
+        return found
+    
     def get_unprocessed_jobs(self, source: Optional[str] = None, limit: int = 100) -> List[Job]:
         """
         Get jobs that haven't been processed yet.
@@ -254,44 +592,46 @@ class DatabaseManager:
         Returns:
             List of unprocessed Job objects
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            if source:
-                cursor.execute("""
-                    SELECT j.* FROM jobs j
-                    LEFT JOIN processed_jobs p ON j.job_id = p.job_id
-                    WHERE p.job_id IS NULL AND j.source = ?
-                    ORDER BY j.scraped_date DESC
-                    LIMIT ?
-                """, (source, limit))
-            else:
-                cursor.execute("""
-                    SELECT j.* FROM jobs j
-                    LEFT JOIN processed_jobs p ON j.job_id = p.job_id
-                    WHERE p.job_id IS NULL
-                    ORDER BY j.scraped_date DESC
-                    LIMIT ?
-                """, (limit,))
-            
-            jobs = []
-            for row in cursor.fetchall():
-                jobs.append(Job(
-                    job_id=row["job_id"],
-                    url=row["url"],
-                    title=row["title"],
-                    organization=row["organization"],
-                    location=row["location"],
-                    description=row["description"],
-                    posted_date=row["posted_date"],
-                    deadline=row["deadline"],
-                    requirements=row["requirements"],
-                    application_url=row["application_url"],
-                    source=row["source"],
-                    raw_data=row["raw_data"]
-                ))
+        return list(self.iter_unprocessed_jobs(source=source, limit=limit))
+    
+    def iter_unprocessed_jobs(self, source: Optional[str] = None, limit: int = 100) -> Iterator[Job]:
+        """
+        Stream jobs that haven't been processed yet, newest first.
+        
+        Args:
+            source: Optional filter by source
+            limit: Maximum number of jobs to yield
             
-            return jobs
+        Yields:
+            Unprocessed Job objects
+        """
+        if source:
+            rows = self._iter_rows(_SQL_UNPROCESSED_JOBS_BY_SOURCE, (source, limit))
+        else:
+            rows = self._iter_rows(_SQL_UNPROCESSED_JOBS, (limit,))
+        for row in rows:
+            yield Job(*row)
+    
+    def _iter_rows(self, query: str, params: tuple) -> Iterator[sqlite3.Row]:
+        """
+        Yield query rows in fetchmany() batches.
+        
+        The lock is only held while a batch is fetched, so a caller that
+        stops early or works slowly between rows doesn't block other users
+        of the connection.
+        """
+        with self._lock:
+            cursor = self.conn.execute(query, params)
+        cursor.arraysize = _FETCH_BATCH_SIZE
+        try:
+            while True:
+                with self._lock:
+                    batch = cursor.fetchmany()
+                if not batch:
+                    return
+                yield from batch
+        finally:
+            cursor.close()
     
     def mark_job_processed(
         self,
@@ -311,34 +651,114 @@ class DatabaseManager:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO processed_jobs (
-                    job_id, url, title, organization, source,
-                    match_score, processed_date, cover_letter_path,
-                    application_status, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.job_id, job.url, job.title, job.organization,
-                job.source, match_score, datetime.now().isoformat(),
-                cover_letter_path, "pending", notes
+            now = datetime.now().isoformat()
+            # Job details are only stored in jobs; make sure the row is there
+            # (a no-op for jobs that came from get_unprocessed_jobs)
+            cursor.execute(_SQL_INSERT_JOB, _job_row(job, now))
+            cursor.execute(_SQL_MARK_PROCESSED, (
+                job.job_id, match_score, now, cover_letter_path, "pending", notes
             ))
             logger.debug(f"Marked job as processed: {job.title} (score: {match_score})")
     
+    def mark_jobs_processed(self, processed: List[Tuple[Job, float, Optional[str]]]) -> None:
+        """
+        Mark multiple jobs as processed in one transaction.
+        
+        Args:
+            processed: (job, match_score, cover_letter_path) tuples
+        """
+        if not processed:
+            return
+        
+        now = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_SQL_INSERT_JOB, [_job_row(job, now) for job, _, _ in processed])
+            cursor.executemany(_SQL_MARK_PROCESSED, [
+                (job.job_id, match_score, now, cover_letter_path, "pending", None)
+                for job, match_score, cover_letter_path in processed
+            ])
+        logger.debug(f"Marked {len(processed)} jobs as processed")
+    
     def save_match_result(self, result: MatchResult) -> None:
         """Save detailed match result."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO match_results (
-                    job_id, match_score, skills_match, experience_match,
-                    research_match, qualification_match, reasoning, matched_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SQL_SAVE_MATCH_RESULT, (
                 result.job_id, result.match_score, result.skills_match,
                 result.experience_match, result.research_match,
                 result.qualification_match, result.reasoning, result.matched_date
             ))
     
+    def get_cached_match(self, cache_key: str, max_age_days: float) -> Optional[str]:
+        """
+        Get a cached match score if it is recent enough.
+        
+        Args:
+            cache_key: Content hash identifying the job/profile pair
+            max_age_days: Ignore entries older than this many days
+            
+        Returns:
+            The serialized score, or None if missing or expired
+        """
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self._get_connection() as conn:
+            row = conn.execute(_SQL_GET_CACHED_MATCH, (cache_key, cutoff)).fetchone()
+            return row["score_json"] if row else None
+    
+    def cache_match(self, cache_key: str, score_json: str) -> None:
+        """
+        Store a serialized match score under its content hash.
+        
+        Args:
+            cache_key: Content hash identifying the job/profile pair
+            score_json: Serialized match score
+        """
+        with self._get_connection() as conn:
+            conn.execute(_SQL_CACHE_MATCH, (cache_key, score_json, datetime.now().isoformat()))
+    
+    def save_match_embedding(self, cache_key: str, context_key: str, embedding: bytes) -> None:
+        """
+        Store a scored job's embedding.
+        
+        Args:
+            cache_key: Match cache key of the job's score
+            context_key: Model/profile context the score belongs to
+            embedding: Raw float32 embedding bytes
+        """
+        with self._get_connection() as conn:
+            conn.execute(_SQL_SAVE_MATCH_EMBEDDING, (
+                cache_key, context_key, embedding, datetime.now().isoformat()
+            ))
+    
+    def get_match_embeddings(self, context_key: str, max_age_days: float) -> List[Tuple[str, bytes]]:
+        """
+        Get the recent embeddings stored for a context.
+        
+        Args:
+            context_key: Model/profile context
+            max_age_days: Ignore embeddings older than this many days
+            
+        Returns:
+            (cache_key, embedding bytes) tuples
+        """
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self._get_connection() as conn:
+            rows = conn.execute(_SQL_MATCH_EMBEDDINGS, (context_key, cutoff)).fetchall()
+            return [(row["cache_key"], row["embedding"]) for row in rows]
+    
+    def save_match_results(self, results: List[MatchResult]) -> None:
+        """Save multiple match results in one transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(_SQL_SAVE_MATCH_RESULT, [
+                (
+                    result.job_id, result.match_score, result.skills_match,
+                    result.experience_match, result.research_match,
+                    result.qualification_match, result.reasoning, result.matched_date
+                )
+                for result in results
+            ])
+    
     def save_cover_letter(self, job_id: str, content: str, file_path: Optional[str] = None) -> int:
         """
         Save a generated cover letter.
@@ -353,12 +773,37 @@ class DatabaseManager:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO cover_letters (job_id, content, file_path, generated_date)
-                VALUES (?, ?, ?, ?)
-            """, (job_id, content, file_path, datetime.now().isoformat()))
+            cursor.execute(_SQL_SAVE_COVER_LETTER, (job_id, content, file_path, datetime.now().isoformat()))
             return cursor.lastrowid
     
+    def save_cover_letters(self, letters: List[Tuple[str, str, Optional[str]]]) -> None:
+        """
+        Save multiple generated cover letters in one transaction.
+        
+        Args:
+            letters: (job_id, content, file_path) tuples
+        """
+        generated_date = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(_SQL_SAVE_COVER_LETTER, [
+                (job_id, content, file_path, generated_date)
+                for job_id, content, file_path in letters
+            ])
+    
+    def get_latest_cover_letter(self, job_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Get the most recently saved cover letter for a job.
+        
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            (content, file_path) tuple, or None if no letter was saved
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(_SQL_LATEST_COVER_LETTER, (job_id,)).fetchone()
+            return (row["content"], row["file_path"]) if row else None
+    
     def get_matched_jobs(
         self,
         min_score: float = 0,
@@ -376,70 +821,48 @@ class DatabaseManager:
         Returns:
             List of ProcessedJob objects
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            query = """
-                SELECT * FROM processed_jobs
-                WHERE match_score >= ?
-            """
-            params = [min_score]
-            
-            if since_date:
-                query += " AND processed_date >= ?"
-                params.append(since_date)
-            
-            query += " ORDER BY match_score DESC, processed_date DESC LIMIT ?"
-            params.append(limit)
-            
-            cursor.execute(query, params)
-            
-            jobs = []
-            for row in cursor.fetchall():
-                jobs.append(ProcessedJob(
-                    job_id=row["job_id"],
-                    url=row["url"],
-                    title=row["title"],
-                    organization=row["organization"],
-                    source=row["source"],
-                    match_score=row["match_score"],
-                    processed_date=row["processed_date"],
-                    cover_letter_path=row["cover_letter_path"],
-                    application_status=row["application_status"],
-                    notes=row["notes"]
-                ))
+        return list(self.iter_matched_jobs(min_score=min_score, since_date=since_date, limit=limit))
+    
+    def iter_matched_jobs(
+        self,
+        min_score: float = 0,
+        since_date: Optional[str] = None,
+        limit: int = 100
+    ) -> Iterator[ProcessedJob]:
+        """
+        Stream processed jobs with match scores above threshold, best first.
+        
+        Args:
+            min_score: Minimum match score
+            since_date: Only get jobs processed since this date (ISO format)
+            limit: Maximum number of jobs to yield
             
-            return jobs
+        Yields:
+            ProcessedJob objects
+        """
+        if since_date:
+            rows = self._iter_rows(_SQL_MATCHED_JOBS_SINCE, (min_score, since_date, limit))
+        else:
+            rows = self._iter_rows(_SQL_MATCHED_JOBS, (min_score, limit))
+        for row in rows:
+            yield ProcessedJob(*row)
     
     def get_job_by_id(self, job_id: str) -> Optional[Job]:
         """Get a job by its ID."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+            cursor.execute(_SQL_GET_JOB, (job_id,))
             row = cursor.fetchone()
             
             if row:
-                return Job(
-                    job_id=row["job_id"],
-                    url=row["url"],
-                    title=row["title"],
-                    organization=row["organization"],
-                    location=row["location"],
-                    description=row["description"],
-                    posted_date=row["posted_date"],
-                    deadline=row["deadline"],
-                    requirements=row["requirements"],
-                    application_url=row["application_url"],
-                    source=row["source"],
-                    raw_data=row["raw_data"]
-                )
+                return Job(*row)
             return None
     
     def get_match_result(self, job_id: str) -> Optional[MatchResult]:
         """Get match result for a job."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM match_results WHERE job_id = ?", (job_id,))
+            cursor.execute(_SQL_GET_MATCH_RESULT, (job_id,))
             row = cursor.fetchone()
             
             if row:
@@ -459,54 +882,38 @@ class DatabaseManager:
         """Update the application status for a job."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            if notes:
-                cursor.execute("""
-                    UPDATE processed_jobs
-                    SET application_status = ?, notes = ?
-                    WHERE job_id = ?
-                """, (status, notes, job_id))
-            else:
-                cursor.execute("""
-                    UPDATE processed_jobs
-                    SET application_status = ?
-                    WHERE job_id = ?
-                """, (status, job_id))
+            cursor.execute(_SQL_UPDATE_STATUS, (status, notes or None, job_id))
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            stats = {}
-            
-            # Total jobs
-            cursor.execute("SELECT COUNT(*) FROM jobs")
-            stats["total_jobs"] = cursor.fetchone()[0]
-            
-            # Jobs by source
-            cursor.execute("SELECT source, COUNT(*) FROM jobs GROUP BY source")
-            stats["jobs_by_source"] = dict(cursor.fetchall())
-            
-            # Processed jobs
-            cursor.execute("SELECT COUNT(*) FROM processed_jobs")
-            stats["processed_jobs"] = cursor.fetchone()[0]
-            
-            # Average match score
-            cursor.execute("SELECT AVG(match_score) FROM processed_jobs")
-            avg = cursor.fetchone()[0]
-            stats["avg_match_score"] = round(avg, 2) if avg else 0
-            
-            # Jobs above threshold
-            cursor.execute("SELECT COUNT(*) FROM processed_jobs WHERE match_score >= 70")
-            stats["matched_jobs"] = cursor.fetchone()[0]
-            
-            # Application status breakdown
-            cursor.execute("""
-                SELECT application_status, COUNT(*)
-                FROM processed_jobs
-                GROUP BY application_status
-            """)
-            stats["status_breakdown"] = dict(cursor.fetchall())
+            # Jobs by source; the total is their sum
+            cursor.execute(_SQL_JOBS_BY_SOURCE)
+            jobs_by_source = dict(cursor.fetchall())
+            
+            # Processed jobs, scores and status breakdown in one scan
+            cursor.execute(_SQL_PROCESSED_SUMMARY)
+            status_breakdown = {}
+            processed = matched = scored = 0
+            score_total = 0.0
+            for status, count, score_sum, score_count, above in cursor.fetchall():
+                status_breakdown[status] = count
+                processed += count
+                matched += above or 0
+                scored += score_count
+                score_total += score_sum or 0
+            
+            avg = score_total / scored if scored else None
+            stats = {
+                "total_jobs": sum(jobs_by_source.values()),
+                "jobs_by_source": jobs_by_source,
+                "processed_jobs": processed,
+                "avg_match_score": round(avg, 2) if avg else 0,
+                "matched_jobs": matched,
+                "status_breakdown": status_breakdown,
+            }
             
             return stats
     
@@ -518,37 +925,29 @@ class DatabaseManager:
             retention_days: Keep records newer than this many days
             
         Returns:
-            Number of records deleted
+            Number of records deleted across all tables
         """
         cutoff_date = (datetime.now() - timedelta(days=retention_days)).isoformat()
         
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Delete old cover letters
-            cursor.execute("""
-                DELETE FROM cover_letters
-                WHERE generated_date < ?
-            """, (cutoff_date,))
-            
-            # Delete old match results
-            cursor.execute("""
-                DELETE FROM match_results
-                WHERE matched_date < ?
-            """, (cutoff_date,))
-            
-            # Delete old processed jobs
-            cursor.execute("""
-                DELETE FROM processed_jobs
-                WHERE processed_date < ?
-            """, (cutoff_date,))
-            
-            # Delete old jobs
-            cursor.execute("""
-                DELETE FROM jobs
-                WHERE scraped_date < ?
-            """, (cutoff_date,))
-            deleted = cursor.rowcount
-            
-            logger.info(f"Cleaned up {deleted} old job records")
-            return deleted
+            # Take the write lock up front so all the deletes share one
+            # transaction and one commit
+            conn.execute("BEGIN IMMEDIATE")
+            deleted = 0
+            for statement in (
+                _SQL_DELETE_OLD_COVER_LETTERS,
+                _SQL_DELETE_OLD_MATCH_RESULTS,
+                _SQL_DELETE_OLD_MATCH_CACHE,
+                _SQL_DELETE_OLD_MATCH_EMBEDDINGS,
+                _SQL_DELETE_OLD_PROCESSED,
+                _SQL_DELETE_OLD_JOBS,
+            ):
+                deleted += conn.execute(statement, (cutoff_date,)).rowcount
+        
+        if deleted:
+            # Give the freed WAL space back to the filesystem
+            with self._lock:
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        
+        logger.info(f"Cleaned up {deleted} old records")
+        return deleted
@@ -5,23 +5,137 @@ Uses Google Gemini to generate personalized cover letters
 based on user profile and job requirements.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import google.generativeai as genai
 from reportlab.lib.pagesizes import letter as letter_size
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Paragraph
 
-from src.database.db_manager import Job
+from src.database.db_manager import DatabaseManager, Job
 from src.matching.matcher import MatchScore
+from src.generator.genai_client import AsyncTokenBucket, get_model
+from src.generator.truncation import truncate_text
 
 logger = logging.getLogger(__name__)
 
+# Characters replaced with "_" in generated filenames. \W is exactly
+# "not str.isalnum() and not _", so this matches the old per-char check.
+_UNSAFE_FILENAME_CHARS = re.compile(r"\W")
+
+# (pattern, replacement) pairs applied in order by _clean_latex
+_LATEX_PATTERNS = tuple((re.compile(pattern), replacement) for pattern, replacement in (
+    (r'\\textbf\{([^}]+)\}', r'\1'),  # Bold
+    (r'\\textit\{([^}]+)\}', r'\1'),  # Italic
+    (r'\\emph\{([^}]+)\}', r'\1'),    # Emphasis
+    (r'\\href\{[^}]+\}\{([^}]+)\}', r'\1'),  # Links
+    (r'\\[a-zA-Z]+\{([^}]+)\}', r'\1'),  # Other commands with args
+    (r'\\[a-zA-Z]+', ''),  # Commands without args
+    (r'\{|\}', ''),  # Remaining braces
+    (r'\\\\', '\n'),  # Line breaks
+    (r'~', ' '),  # Non-breaking spaces
+    (r'\n{3,}', '\n\n'),  # Extra blank lines
+))
+
+# Output cap for one letter: 300-400 words is ~550 tokens, plus the date,
+# salutation and closing, with headroom so letters aren't cut off
+_MAX_LETTER_TOKENS = 1024
+
+# Static parts of the system instruction; the past-letter style insights
+# go between them (see _build_system_prompt)
+_SYSTEM_PROMPT_HEADER = """You are an expert career advisor helping a Development Economics professional write a compelling cover letter.
+
+You will be given the candidate profile and a job posting, and possibly a match analysis and a template to follow.
+"""
+
+_COVER_LETTER_INSTRUCTIONS = """
+## INSTRUCTIONS:
+Write a professional, personalized cover letter (300-400 words) that:
+
+1. Opens with a compelling hook mentioning the specific role and organization
+2. Highlights 2-3 most relevant experiences/skills that match the job requirements
+3. Demonstrates knowledge of the organization's work and mission
+4. Shows enthusiasm for the role and how it aligns with career goals
+5. Concludes with a confident call to action
+6. Never use dashes or bullet points
+7. Never use word "delve", "hone" or similar overly formal words
+
+Style Guidelines:
+- Professional but personable tone
+- Specific examples over generic claims
+- Focus on Development Economics, research, and analytical skills
+- No clichés or overly formal language
+- Show, don't tell
+
+Format the letter professionally with:
+- Today's date
+- Proper salutation (Dear Hiring Manager if no specific name)
+- Clear paragraphs
+- Professional closing
+
+Write ONLY the cover letter, no additional commentary."""
+
+# Character budgets for long prompt fields (see truncate_text)
+_PROMPT_BUDGETS = {
+    "description": 2000,
+    "requirements": 800,
+    "experience": 1500,
+    "education": 500,
+}
+
+# Directory under output_dir holding cached past-letter style analyses
+_STYLE_CACHE_DIR = ".style_cache"
+
+# Past cover letter file types mapped to their load order
+_PAST_LETTER_EXTENSIONS = {".md": 0, ".txt": 1, ".tex": 2}
+
+# Paragraph separator in generated letters; runs of blank lines count as one
+_PARAGRAPH_BREAK = re.compile(r"\n{2,}")
+
+
+async def _gather_bounded(
+    calls: Iterable[Callable[[], Awaitable[Any]]],
+    concurrency: int
+) -> List[Any]:
+    """
+    Run coroutine factories with at most `concurrency` running at once.
+    
+    Returns:
+        Each call's result or raised exception, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def bounded(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+    
+    return await asyncio.gather(*(bounded(call) for call in calls), return_exceptions=True)
+
+
+@lru_cache(maxsize=1)
+def _pdf_body_style() -> ParagraphStyle:
+    """Body text style for cover letter PDFs, built once and shared."""
+    styles = getSampleStyleSheet()
+    return ParagraphStyle(
+        'Body',
+        parent=styles['Normal'],
+        fontSize=11,
+        leading=14,
+        # Whole paragraph gap, so the story needs no Spacer flowables
+        spaceAfter=18,
+    )
+
 
 class CoverLetterGenerator:
     """
@@ -37,7 +151,8 @@ class CoverLetterGenerator:
         model: str = "gemini-2.5-flash",
         temperature: float = 0.7,
         output_dir: str = "output/cover_letters",
-        past_letters_dir: str = "templates/past_cover_letters"
+        past_letters_dir: str = "templates/past_cover_letters",
+        rate_limiter: Optional[AsyncTokenBucket] = None
     ):
         """
         Initialize cover letter generator.
@@ -48,21 +163,44 @@ class CoverLetterGenerator:
             temperature: Generation temperature
             output_dir: Directory to save generated cover letters
             past_letters_dir: Directory containing past cover letters for style learning
+            rate_limiter: Optional limiter acquired before each async request
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         self.past_letters_dir = Path(past_letters_dir)
+        self._past_letters_cache: Optional[List[Dict[str, str]]] = None
         
         # Configure Gemini
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        self.model = get_model(api_key, model)
         self.temperature = temperature
-        
-        # Load and analyze past cover letters
-        self.past_letters_insights = self._analyze_past_letters()
-        
-        logger.info(f"Initialized CoverLetterGenerator with {len(self._load_past_letters())} past letters for reference")
+        self.rate_limiter = rate_limiter
+        
+        # Profile block of the last profile seen, reused while the same
+        # profile object is passed in (see _profile_block)
+        self._profile_cache: Optional[Tuple[Dict[str, Any], str]] = None
+        # Same for the job posting block, so retries and regenerations of
+        # one job don't re-truncate and re-format its description
+        self._job_cache: Optional[Tuple[Job, str]] = None
+        
+        # PDF rendering is CPU-bound ReportLab work; run it in the background
+        # so the next Gemini request doesn't wait on it. See flush().
+        self._pdf_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cover-letter-pdf")
+        self._pdf_futures: List[Future] = []
+        self._pdf_futures_lock = threading.Lock()
+        
+        # Load and analyze past cover letters (read once and kept for the
+        # log line below and get_past_letters_summary)
+        past_letters = self._load_past_letters()
+        self.past_letters_insights = self._analyze_past_letters(past_letters)
+        
+        # The job-agnostic instructions (including the style insights above)
+        # go into the system instruction once, so each request only carries
+        # the profile and the job
+        self.system_prompt = self._build_system_prompt()
+        self.model = get_model(api_key, model, self.system_prompt)
+        
+        logger.info(f"Initialized CoverLetterGenerator with {len(past_letters)} past letters for reference")
     
     def generate(
         self,
@@ -88,10 +226,7 @@ class CoverLetterGenerator:
         try:
             response = self.model.generate_content(
                 prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=self.temperature,
-                    max_output_tokens=2048,
-                )
+                generation_config=self._generation_config()
             )
             
             cover_letter = response.text.strip()
@@ -102,6 +237,71 @@ class CoverLetterGenerator:
             logger.error(f"Error generating cover letter: {e}")
             raise
     
+    async def generate_async(
+        self,
+        job: Job,
+        profile: Dict[str, Any],
+        match_score: Optional[MatchScore] = None,
+        template: Optional[str] = None
+    ) -> str:
+        """
+        Generate a cover letter without blocking the event loop.
+        
+        Same arguments and result as generate().
+        """
+        prompt = self._build_generation_prompt(job, profile, match_score, template)
+        
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=self._generation_config()
+            )
+            
+            cover_letter = response.text.strip()
+            logger.info(f"Generated cover letter for {job.title} at {job.organization}")
+            return cover_letter
+            
+        except Exception as e:
+            logger.error(f"Error generating cover letter: {e}")
+            raise
+    
+    async def generate_many(
+        self,
+        items: Sequence[Tuple[Job, Optional[MatchScore]]],
+        profile: Dict[str, Any],
+        template: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[Union[str, BaseException]]:
+        """
+        Generate cover letters for several jobs with overlapping requests.
+        
+        Args:
+            items: (job, match_score) pairs
+            profile: User profile dictionary
+            template: Optional custom template
+            concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            One entry per item, in order: the cover letter text, or the
+            exception raised while generating it
+        """
+        return await _gather_bounded(
+            (
+                partial(self.generate_async, job, profile, match_score, template)
+                for job, match_score in items
+            ),
+            concurrency
+        )
+    
+    def _generation_config(self) -> "genai.types.GenerationConfig":
+        """Generation settings shared by generate() and generate_async()."""
+        return genai.types.GenerationConfig(
+            temperature=self.temperature,
+            max_output_tokens=_MAX_LETTER_TOKENS,
+        )
+    
     def generate_and_save(
         self,
         job: Job,
@@ -120,16 +320,151 @@ class CoverLetterGenerator:
             match_score: Optional match score
             template: Optional custom template
             save_md: Save as Markdown file (default: True) - editable!
-            save_pdf: Save as PDF (default: False)
+            save_pdf: Save as PDF (default: False); written in the
+                background, call flush() before reading it
             
         Returns:
             Dictionary with file paths
         """
         cover_letter = self.generate(job, profile, match_score, template)
+        return self.save(job, profile, cover_letter, save_md=save_md, save_pdf=save_pdf)
+    
+    async def generate_and_save_async(
+        self,
+        job: Job,
+        profile: Dict[str, Any],
+        match_score: Optional[MatchScore] = None,
+        template: Optional[str] = None,
+        save_md: bool = True,
+        save_pdf: bool = False
+    ) -> Dict[str, str]:
+        """
+        Async counterpart of generate_and_save().
+        
+        File writing runs in a worker thread so it doesn't stall other
+        requests on the event loop.
+        """
+        cover_letter = await self.generate_async(job, profile, match_score, template)
+        return await asyncio.to_thread(
+            self.save, job, profile, cover_letter, save_md=save_md, save_pdf=save_pdf
+        )
+    
+    async def generate_and_save_many(
+        self,
+        items: Sequence[Tuple[Job, Optional[MatchScore]]],
+        profile: Dict[str, Any],
+        template: Optional[str] = None,
+        concurrency: int = 8,
+        save_md: bool = True,
+        save_pdf: bool = False
+    ) -> List[Union[Dict[str, str], BaseException]]:
+        """
+        Generate and save cover letters for several jobs concurrently.
+        
+        Each letter is written as soon as its request completes, while
+        the other requests are still in flight.
         
+        Args:
+            items: (job, match_score) pairs
+            profile: User profile dictionary
+            template: Optional custom template
+            concurrency: Maximum number of requests in flight at once
+            save_md: Save as Markdown files
+            save_pdf: Save as PDFs; call flush() before reading them
+            
+        Returns:
+            One entry per item, in order: the saved file paths, or the
+            exception raised while generating or saving the letter
+        """
+        return await _gather_bounded(
+            (
+                partial(
+                    self.generate_and_save_async, job, profile, match_score, template,
+                    save_md=save_md, save_pdf=save_pdf
+                )
+                for job, match_score in items
+            ),
+            concurrency
+        )
+    
+    def get_or_generate(
+        self,
+        job: Job,
+        profile: Dict[str, Any],
+        db: DatabaseManager,
+        match_score: Optional[MatchScore] = None,
+        template: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Return the saved cover letter for a job, generating one if needed.
+        
+        A letter counts as saved when the database has a record for the job
+        and its file still exists. Newly generated letters are recorded in
+        the database.
+        
+        Args:
+            job: Job posting
+            profile: User profile dictionary
+            db: Database holding previously generated letters
+            match_score: Optional match score
+            template: Optional custom template
+            
+        Returns:
+            Dictionary with file paths
+        """
+        paths = self.cached_paths(job, db)
+        if paths:
+            logger.info(f"Reusing cover letter for {job.title} at {job.organization}")
+            return paths
+        
+        cover_letter = self.generate(job, profile, match_score, template)
+        paths = self.save(job, profile, cover_letter)
+        db.save_cover_letter(job.job_id, cover_letter, paths.get("md") or paths.get("pdf"))
+        return paths
+    
+    @staticmethod
+    def cached_paths(job: Job, db: DatabaseManager) -> Dict[str, str]:
+        """
+        Look up a previously saved cover letter file for a job.
+        
+        Returns:
+            Dictionary with the file path keyed by type ("md" or "pdf"),
+            or an empty dict if there is no usable saved letter
+        """
+        latest = db.get_latest_cover_letter(job.job_id)
+        if not latest or not latest[1]:
+            return {}
+        
+        path = Path(latest[1])
+        if not path.is_file():
+            return {}
+        return {path.suffix.lstrip(".") or "md": str(path)}
+    
+    def save(
+        self,
+        job: Job,
+        profile: Dict[str, Any],
+        cover_letter: str,
+        save_md: bool = True,
+        save_pdf: bool = False
+    ) -> Dict[str, str]:
+        """
+        Save an already generated cover letter to files.
+        
+        Args:
+            job: Job posting
+            profile: User profile dictionary
+            cover_letter: Cover letter text
+            save_md: Save as Markdown file (default: True)
+            save_pdf: Save as PDF (default: False); written in the
+                background, call flush() before reading it
+            
+        Returns:
+            Dictionary with file paths
+        """
         # Generate filename
-        safe_org = "".join(c if c.isalnum() else "_" for c in job.organization)[:30]
-        safe_title = "".join(c if c.isalnum() else "_" for c in job.title)[:30]
+        safe_org = _UNSAFE_FILENAME_CHARS.sub("_", job.organization[:30])
+        safe_title = _UNSAFE_FILENAME_CHARS.sub("_", job.title[:30])
         timestamp = datetime.now().strftime("%Y%m%d")
         base_filename = f"cover_letter_{safe_org}_{safe_title}_{timestamp}"
         
@@ -158,20 +493,74 @@ class CoverLetterGenerator:
 
 **{profile.get("name", "")}**
 """
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            md_path.write_bytes(md_content.encode("utf-8"))
             paths["md"] = str(md_path)
             logger.debug(f"Saved cover letter to {md_path}")
         
         # Save PDF (optional)
         if save_pdf:
             pdf_path = self.output_dir / f"{base_filename}.pdf"
-            self._save_as_pdf(cover_letter, pdf_path, profile.get("name", ""))
+            future = self._pdf_pool.submit(self._save_as_pdf, cover_letter, pdf_path, profile.get("name", ""))
+            with self._pdf_futures_lock:
+                self._pdf_futures.append(future)
             paths["pdf"] = str(pdf_path)
-            logger.debug(f"Saved cover letter PDF to {pdf_path}")
+            logger.debug(f"Queued cover letter PDF for {pdf_path}")
         
         return paths
     
+    def flush(self) -> None:
+        """Block until all queued PDF files have been written."""
+        with self._pdf_futures_lock:
+            pending, self._pdf_futures = self._pdf_futures, []
+        wait(pending)
+    
+    def _build_system_prompt(self) -> str:
+        """Build the job-independent instructions used as the system instruction."""
+        
+        # Include past letters style insights
+        style_insights = ""
+        if self.past_letters_insights:
+            style_insights = f"""
+## WRITING STYLE (based on candidate's past cover letters):
+{self.past_letters_insights}
+
+IMPORTANT: Write in this same style and voice. Use similar phrases and structure patterns where appropriate.
+"""
+        
+        return "".join((_SYSTEM_PROMPT_HEADER, style_insights, _COVER_LETTER_INSTRUCTIONS))
+    
+    def _profile_block(self, profile: Dict[str, Any]) -> str:
+        """Format the candidate profile section, cached per profile object."""
+        cached = self._profile_cache
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+        
+        block = f"""## CANDIDATE PROFILE:
+Name: {profile.get('name', '[Name]')}
+Email: {profile.get('email', '')}
+Summary: {profile.get('summary', '')}
+Skills: {', '.join(profile.get('skills', []))}
+Education: {truncate_text(profile.get('education', ''), _PROMPT_BUDGETS['education'])}
+Experience: {truncate_text(profile.get('experience', ''), _PROMPT_BUDGETS['experience'])}
+Research Interests: {', '.join(profile.get('research_interests', []))}"""
+        self._profile_cache = (profile, block)
+        return block
+    
+    def _job_block(self, job: Job) -> str:
+        """Format the job posting section, cached per job object."""
+        cached = self._job_cache
+        if cached is not None and cached[0] is job:
+            return cached[1]
+        
+        block = f"""## JOB POSTING:
+Title: {job.title}
+Organization: {job.organization}
+Location: {job.location}
+Description: {truncate_text(job.description, _PROMPT_BUDGETS['description']) if job.description else 'Not provided'}
+Requirements: {truncate_text(job.requirements, _PROMPT_BUDGETS['requirements']) if job.requirements else 'Not provided'}"""
+        self._job_cache = (job, block)
+        return block
+    
     def _build_generation_prompt(
         self,
         job: Job,
@@ -179,7 +568,7 @@ class CoverLetterGenerator:
         match_score: Optional[MatchScore],
         template: Optional[str]
     ) -> str:
-        """Build the prompt for cover letter generation."""
+        """Build the per-job prompt; instructions live in the system prompt."""
         
         # Include match insights if available
         match_insights = ""
@@ -189,16 +578,6 @@ class CoverLetterGenerator:
 - Key Strengths: {', '.join(match_score.highlights[:3]) if match_score.highlights else 'General alignment'}
 - Areas to Address: {', '.join(match_score.concerns[:2]) if match_score.concerns else 'None critical'}
 - Match Reasoning: {match_score.reasoning}
-"""
-        
-        # Include past letters style insights
-        style_insights = ""
-        if self.past_letters_insights:
-            style_insights = f"""
-## WRITING STYLE (based on candidate's past cover letters):
-{self.past_letters_insights}
-
-IMPORTANT: Write in this same style and voice. Use similar phrases and structure patterns where appropriate.
 """
         
         template_instruction = ""
@@ -210,52 +589,13 @@ IMPORTANT: Write in this same style and voice. Use similar phrases and structure
 Adapt this template structure while personalizing the content.
 """
         
-        return f"""You are an expert career advisor helping a Development Economics professional write a compelling cover letter.
-
-## CANDIDATE PROFILE:
-Name: {profile.get('name', '[Name]')}
-Email: {profile.get('email', '')}
-Summary: {profile.get('summary', '')}
-Skills: {', '.join(profile.get('skills', []))}
-Education: {profile.get('education', '')}
-Experience: {profile.get('experience', '')}
-Research Interests: {', '.join(profile.get('research_interests', []))}
-
-## JOB POSTING:
-Title: {job.title}
-Organization: {job.organization}
-Location: {job.location}
-Description: {job.description[:2500] if job.description else 'Not provided'}
-Requirements: {job.requirements[:1000] if job.requirements else 'Not provided'}
-{match_insights}
-{style_insights}
-{template_instruction}
-
-## INSTRUCTIONS:
-Write a professional, personalized cover letter (300-400 words) that:
+        # Most stable content first (template, then profile) so requests in
+        # a batch share the longest possible prefix
+        return f"""{template_instruction}
+{self._profile_block(profile)}
 
-1. Opens with a compelling hook mentioning the specific role and organization
-2. Highlights 2-3 most relevant experiences/skills that match the job requirements
-3. Demonstrates knowledge of the organization's work and mission
-4. Shows enthusiasm for the role and how it aligns with career goals
-5. Concludes with a confident call to action
-6. Never use dashes or bullet points
-7. Never use word "delve", "hone" or similar overly formal words
-
-Style Guidelines:
-- Professional but personable tone
-- Specific examples over generic claims
-- Focus on Development Economics, research, and analytical skills
-- No clichés or overly formal language
-- Show, don't tell
-
-Format the letter professionally with:
-- Today's date
-- Proper salutation (Dear Hiring Manager if no specific name)
-- Clear paragraphs
-- Professional closing
-
-Write ONLY the cover letter, no additional commentary."""
+{self._job_block(job)}
+{match_insights}"""
     
     def _save_as_pdf(self, content: str, output_path: Path, name: str) -> None:
         """Save cover letter as PDF using ReportLab."""
@@ -269,28 +609,15 @@ Write ONLY the cover letter, no additional commentary."""
                 bottomMargin=inch
             )
             
-            styles = getSampleStyleSheet()
+            body_style = _pdf_body_style()
             
-            # Custom style for body text
-            body_style = ParagraphStyle(
-                'Body',
-                parent=styles['Normal'],
-                fontSize=11,
-                leading=14,
-                spaceAfter=12,
-            )
-            
-            # Build content
-            story = []
-            
-            # Split content into paragraphs
-            paragraphs = content.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    # Handle line breaks within paragraphs
-                    para = para.replace('\n', '<br/>')
-                    story.append(Paragraph(para, body_style))
-                    story.append(Spacer(1, 6))
+            # Build content: one Paragraph per non-blank paragraph, with line
+            # breaks inside a paragraph kept as <br/>
+            story = [
+                Paragraph(para.replace('\n', '<br/>'), body_style)
+                for para in _PARAGRAPH_BREAK.split(content)
+                if para.strip()
+            ]
             
             doc.build(story)
             
@@ -298,8 +625,7 @@ Write ONLY the cover letter, no additional commentary."""
             logger.error(f"Failed to create PDF: {e}")
             # Fall back to saving as text if PDF fails
             output_path = output_path.with_suffix('.txt')
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            output_path.write_bytes(content.encode('utf-8'))
     
     def load_template(self, template_path: str) -> str:
         """Load a cover letter template from file."""
@@ -310,37 +636,46 @@ Write ONLY the cover letter, no additional commentary."""
         """
         Load past cover letters from the configured directory.
         
-        Supports .md, .txt, and .tex files.
+        Supports .md, .txt, and .tex files. The directory is read once per
+        generator; later calls return the same list.
         
         Returns:
             List of dicts with 'filename' and 'content' keys
         """
+        if self._past_letters_cache is not None:
+            return self._past_letters_cache
+        
         letters = []
+        self._past_letters_cache = letters
         
         if not self.past_letters_dir.exists():
             logger.warning(f"Past letters directory not found: {self.past_letters_dir}")
             return letters
         
-        # Supported file extensions
-        extensions = [".md", ".txt", ".tex"]
-        
-        for ext in extensions:
-            for file_path in self.past_letters_dir.glob(f"*{ext}"):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Clean up LaTeX files
-                    if ext == ".tex":
-                        content = self._clean_latex(content)
-                    
-                    letters.append({
-                        'filename': file_path.name,
-                        'content': content
-                    })
-                    logger.debug(f"Loaded past letter: {file_path.name}")
-                except Exception as e:
-                    logger.warning(f"Failed to load {file_path}: {e}")
+        # One directory pass; files are ordered by extension and then by name
+        file_paths = sorted(
+            (
+                path for path in self.past_letters_dir.iterdir()
+                if path.suffix in _PAST_LETTER_EXTENSIONS and path.is_file()
+            ),
+            key=lambda path: (_PAST_LETTER_EXTENSIONS[path.suffix], path.name)
+        )
+        
+        for file_path in file_paths:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+                
+                # Clean up LaTeX files
+                if file_path.suffix == ".tex":
+                    content = self._clean_latex(content)
+                
+                letters.append({
+                    'filename': file_path.name,
+                    'content': content
+                })
+                logger.debug(f"Loaded past letter: {file_path.name}")
+            except Exception as e:
+                logger.warning(f"Failed to load {file_path}: {e}")
         
         return letters
     
@@ -350,8 +685,6 @@ Write ONLY the cover letter, no additional commentary."""
         
         Removes common LaTeX commands while preserving text.
         """
-        import re
-        
         # Remove LaTeX preamble (everything before \begin{document})
         if r"\begin{document}" in content:
             content = content.split(r"\begin{document}")[1]
@@ -359,38 +692,32 @@ Write ONLY the cover letter, no additional commentary."""
             content = content.split(r"\end{document}")[0]
         
         # Remove common LaTeX commands
-        patterns = [
-            (r'\\textbf\{([^}]+)\}', r'\1'),  # Bold
-            (r'\\textit\{([^}]+)\}', r'\1'),  # Italic
-            (r'\\emph\{([^}]+)\}', r'\1'),    # Emphasis
-            (r'\\href\{[^}]+\}\{([^}]+)\}', r'\1'),  # Links
-            (r'\\[a-zA-Z]+\{([^}]+)\}', r'\1'),  # Other commands with args
-            (r'\\[a-zA-Z]+', ''),  # Commands without args
-            (r'\{|\}', ''),  # Remaining braces
-            (r'\\\\', '\n'),  # Line breaks
-            (r'~', ' '),  # Non-breaking spaces
-        ]
-        
-        for pattern, replacement in patterns:
-            content = re.sub(pattern, replacement, content)
-        
-        # Clean up extra whitespace
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        for pattern, replacement in _LATEX_PATTERNS:
+            content = pattern.sub(replacement, content)
         
         return content.strip()
     
-    def _analyze_past_letters(self) -> str:
+    def _analyze_past_letters(self, letters: Optional[List[Dict[str, str]]] = None) -> str:
         """
         Analyze past cover letters to extract style insights.
         
+        Args:
+            letters: Already loaded past letters; loaded if not given
+        
         Returns:
             String with insights about writing style, phrases, and patterns
         """
-        letters = self._load_past_letters()
+        if letters is None:
+            letters = self._load_past_letters()
         
         if not letters:
             return ""
         
+        # A single letter has no patterns to compare; use it directly as the
+        # style sample instead of asking Gemini to summarize it
+        if len(letters) == 1:
+            return f"Sample reference letter (match this voice):\n{letters[0]['content'][:1200]}"
+        
         # Build analysis prompt
         letters_text = "\n\n---\n\n".join([
             f"### {item['filename']}\n{item['content'][:2000]}" 
@@ -411,6 +738,19 @@ PAST COVER LETTERS:
 
 Provide a concise analysis (200 words max) that can guide writing new cover letters in the same style."""
         
+        # The analysis only depends on the prompt and the model, so reuse a
+        # previous result for the same letters instead of asking again
+        cache_key = hashlib.sha256(
+            f"{self.model.model_name}\n{analysis_prompt}".encode("utf-8")
+        ).hexdigest()
+        cache_path = self.output_dir / _STYLE_CACHE_DIR / f"{cache_key}.txt"
+        try:
+            insights = cache_path.read_text(encoding="utf-8")
+            logger.info("Loaded cached style insights for past cover letters")
+            return insights
+        except OSError:
+            pass
+        
         try:
             response = self.model.generate_content(
                 analysis_prompt,
@@ -421,10 +761,17 @@ Provide a concise analysis (200 words max) that can guide writing new cover lett
             )
             insights = response.text.strip()
             logger.info("Successfully analyzed past cover letters for style insights")
-            return insights
         except Exception as e:
             logger.warning(f"Failed to analyze past letters: {e}")
             return ""
+        
+        if insights:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(insights.encode("utf-8"))
+            except OSError as e:
+                logger.debug(f"Could not cache style insights: {e}")
+        return insights
     
     def get_past_letters_summary(self) -> str:
         """
@@ -0,0 +1,109 @@
+"""
+Shared Gemini Client
+
+Configures google-generativeai once per API key and hands out shared
+GenerativeModel instances, so the matcher, cover letter generator and
+question answerer reuse one client (and its connection) per process.
+Also provides the request rate limiter those components share.
+"""
+
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
+
+import google.generativeai as genai
+
+_configure_lock = threading.Lock()
+_configured_key: Optional[str] = None
+
+
+def configure(api_key: str) -> None:
+    """
+    Configure the Gemini SDK, skipping the call if the key is unchanged.
+    
+    genai.configure() drops the SDK's cached clients, so calling it again
+    with the same key would throw away an already-open connection.
+    """
+    global _configured_key
+    with _configure_lock:
+        if _configured_key != api_key:
+            genai.configure(api_key=api_key)
+            _configured_key = api_key
+
+
+@lru_cache(maxsize=8)
+def get_model(
+    api_key: str,
+    model_name: str,
+    system_instruction: Optional[str] = None
+) -> genai.GenerativeModel:
+    """
+    Get a shared GenerativeModel for a model name and system instruction.
+    
+    Args:
+        api_key: Google Gemini API key
+        model_name: Gemini model to use
+        system_instruction: Optional system instruction baked into the model
+    
+    Returns:
+        GenerativeModel instance, the same one for repeated arguments
+    """
+    configure(api_key)
+    return genai.GenerativeModel(model_name, system_instruction=system_instruction)
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket limiting how fast async callers may send Gemini requests.
+    
+    Tokens refill continuously at `rate` per second up to `burst`; each
+    request takes one. Callers that find the bucket empty reserve a token
+    anyway and sleep until it would have refilled, so waiters are served
+    in arrival order without a lock held across the sleep.
+    
+    The state is guarded by a threading lock rather than an asyncio one,
+    so one bucket can be shared by several event loops (each
+    asyncio.run() call creates a new loop).
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket, starting full.
+        
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum requests sent back to back after an idle period
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: int = 1) -> Optional["AsyncTokenBucket"]:
+        """
+        Build a bucket from a requests-per-minute limit.
+        
+        Returns:
+            The bucket, or None if the limit is not positive (unlimited)
+        """
+        if requests_per_minute <= 0:
+            return None
+        return cls(requests_per_minute / 60, burst)
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then take a token."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if delay:
+            await asyncio.sleep(delay)
@@ -5,15 +5,99 @@ Uses Google Gemini to generate personalized answers to
 job application questions based on user profile.
 """
 
+import json
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 import google.generativeai as genai
 
 from src.database.db_manager import Job
+from src.generator.genai_client import get_model
+from src.generator.truncation import truncate_text
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_PROMPT = """You are an expert career advisor helping a Development Economics professional answer application questions.
+
+You will be given the candidate profile, optionally the job and additional context, and then the application question.
+
+## INSTRUCTIONS:
+Write a compelling, professional answer that:
+
+1. Directly addresses the question
+2. Uses specific examples from the candidate's background
+3. Demonstrates relevant skills and experience
+4. Shows enthusiasm and fit for the role
+5. Is honest and authentic in tone
+
+Guidelines:
+- Be specific, not generic
+- Use the STAR method (Situation, Task, Action, Result) for behavioral questions
+- Quantify achievements where possible
+- Focus on Development Economics and research experience
+- Match the tone to the organization (e.g., more formal for UN, slightly less for NGOs)
+- Respect the word limit if one is given
+
+Write ONLY the answer, no additional commentary or formatting."""
+
+
+# Character budgets for long prompt fields (see truncate_text)
+_PROMPT_BUDGETS = {
+    "description": 1500,
+    "experience": 1500,
+    "education": 500,
+}
+
+# Common questions for development economics roles
+_COMMON_QUESTIONS = (
+    "Why are you interested in this position?",
+    "Describe your experience with impact evaluation or research methodology.",
+    "How does your background align with our organization's mission?",
+    "Describe a challenging research project you've worked on and how you overcame obstacles.",
+    "What is your experience working with data analysis tools (Stata, R, Python)?",
+    "Tell us about your experience working in developing countries or cross-cultural settings.",
+    "How do you prioritize tasks when managing multiple projects?",
+    "Describe your experience with policy-relevant research.",
+)
+
+# Role-specific questions, added when any of the keywords appear in the
+# job description
+_ROLE_QUESTIONS = (
+    (("management", "lead"), (
+        "Describe your experience managing a team or project.",
+        "How do you handle conflicts within a team?",
+    )),
+    (("field", "survey"), (
+        "Describe your experience with field research or data collection.",
+        "How do you ensure data quality in field settings?",
+    )),
+    (("publication", "writing"), (
+        "Describe your publication experience or a paper you've contributed to.",
+        "How do you communicate complex research findings to non-technical audiences?",
+    )),
+)
+
+
+@lru_cache(maxsize=256)
+def _suggest_from_description(description_lower: str) -> Tuple[str, ...]:
+    """Suggested questions for a lowercased job description (cached)."""
+    questions = list(_COMMON_QUESTIONS)
+    
+    # Add role-specific questions based on job content
+    for keywords, extra in _ROLE_QUESTIONS:
+        if any(keyword in description_lower for keyword in keywords):
+            questions.extend(extra)
+    
+    return tuple(questions[:8])  # Return top 8 most relevant
+
+
+
+def _answer_token_budget(max_words: Optional[int]) -> int:
+    """Output token cap for one answer: ~2 tokens per allowed word, at most 1024."""
+    if max_words:
+        return max(128, min(1024, max_words * 2))
+    return 1024
 
 class QuestionAnswerer:
     """
@@ -37,8 +121,9 @@ class QuestionAnswerer:
             model: Gemini model to use
             temperature: Generation temperature
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        # Persona and instructions are the same for every question, so they
+        # are sent once as the system instruction rather than in each prompt
+        self.model = get_model(api_key, model, _SYSTEM_PROMPT)
         self.temperature = temperature
         
         logger.info("Initialized QuestionAnswerer")
@@ -71,7 +156,39 @@ class QuestionAnswerer:
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=self.temperature,
-                    max_output_tokens=1024,
+                    max_output_tokens=_answer_token_budget(max_words),
+                )
+            )
+            
+            answer = response.text.strip()
+            logger.info(f"Generated answer for question: {question[:50]}...")
+            return answer
+            
+        except Exception as e:
+            logger.error(f"Error generating answer: {e}")
+            raise
+    
+    async def answer_question_async(
+        self,
+        question: str,
+        profile: Dict[str, Any],
+        job: Optional[Job] = None,
+        max_words: Optional[int] = None,
+        context: Optional[str] = None
+    ) -> str:
+        """
+        Generate an answer without blocking the event loop.
+        
+        Same arguments and result as answer_question().
+        """
+        prompt = self._build_answer_prompt(question, profile, job, max_words, context)
+        
+        try:
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=genai.types.GenerationConfig(
+                    temperature=self.temperature,
+                    max_output_tokens=_answer_token_budget(max_words),
                 )
             )
             
@@ -100,6 +217,17 @@ class QuestionAnswerer:
         Returns:
             List of dictionaries with 'question' and 'answer' keys
         """
+        if not questions:
+            return []
+        
+        # One request for all questions; fall back to one request per
+        # question if the batched response can't be used
+        if len(questions) > 1:
+            try:
+                return self._answer_questions_batch(questions, profile, job)
+            except Exception as e:
+                logger.warning(f"Batched answering failed, answering questions one by one: {e}")
+        
         results = []
         
         for q in questions:
@@ -122,6 +250,43 @@ class QuestionAnswerer:
         
         return results
     
+    def _answer_questions_batch(
+        self,
+        questions: List[Dict[str, Any]],
+        profile: Dict[str, Any],
+        job: Optional[Job]
+    ) -> List[Dict[str, str]]:
+        """
+        Answer all questions with a single JSON-mode request.
+        
+        Raises:
+            ValueError: If the response is missing an answer for any question
+        """
+        prompt = self._build_batch_answer_prompt(questions, profile, job)
+        response = self.model.generate_content(
+            prompt,
+            generation_config=genai.types.GenerationConfig(
+                temperature=self.temperature,
+                # Per-answer caps plus room for the JSON wrapping of each entry
+                max_output_tokens=sum(_answer_token_budget(q.get("max_words")) + 32 for q in questions),
+                response_mime_type="application/json",
+            )
+        )
+        
+        answers = {
+            int(item["idx"]): str(item["answer"]).strip()
+            for item in json.loads(response.text)["answers"]
+        }
+        missing = [idx for idx in range(1, len(questions) + 1) if not answers.get(idx)]
+        if missing:
+            raise ValueError(f"No answer for question(s) {missing}")
+        
+        logger.info(f"Generated answers for {len(questions)} questions in one request")
+        return [
+            {"question": q.get("question", ""), "answer": answers[idx]}
+            for idx, q in enumerate(questions, start=1)
+        ]
+    
     def _build_answer_prompt(
         self,
         question: str,
@@ -132,15 +297,6 @@ class QuestionAnswerer:
     ) -> str:
         """Build the prompt for answer generation."""
         
-        job_context = ""
-        if job:
-            job_context = f"""
-## JOB CONTEXT:
-Title: {job.title}
-Organization: {job.organization}
-Description: {job.description[:1500] if job.description else 'Not provided'}
-"""
-        
         additional_context = ""
         if context:
             additional_context = f"""
@@ -152,39 +308,60 @@ Description: {job.description[:1500] if job.description else 'Not provided'}
         if max_words:
             word_limit = f"\n**Word Limit: {max_words} words maximum**"
         
-        return f"""You are an expert career advisor helping a Development Economics professional answer application questions.
-
-## CANDIDATE PROFILE:
-Name: {profile.get('name', 'Candidate')}
-Summary: {profile.get('summary', '')}
-Skills: {', '.join(profile.get('skills', []))}
-Education: {profile.get('education', '')}
-Experience: {profile.get('experience', '')}
-Research Interests: {', '.join(profile.get('research_interests', []))}
-{job_context}
+        # Invariant instructions live in the system prompt; the profile and
+        # job come before the question so consecutive questions share a prefix
+        return f"""{self._build_context_block(profile, job)}
 {additional_context}
 
 ## APPLICATION QUESTION:
 {question}
-{word_limit}
-
-## INSTRUCTIONS:
-Write a compelling, professional answer that:
-
-1. Directly addresses the question
-2. Uses specific examples from the candidate's background
-3. Demonstrates relevant skills and experience
-4. Shows enthusiasm and fit for the role
-5. Is honest and authentic in tone
+{word_limit}"""
+    
+    def _build_batch_answer_prompt(
+        self,
+        questions: List[Dict[str, Any]],
+        profile: Dict[str, Any],
+        job: Optional[Job]
+    ) -> str:
+        """Build one prompt asking for answers to all questions as JSON."""
+        numbered = []
+        for idx, q in enumerate(questions, start=1):
+            entry = f"{idx}. {q.get('question', '')}"
+            if q.get("max_words"):
+                entry += f" (Word Limit: {q['max_words']} words maximum)"
+            if q.get("context"):
+                entry += f"\n   Additional context: {q['context']}"
+            numbered.append(entry)
+        questions_text = "\n".join(numbered)
+        
+        return f"""{self._build_context_block(profile, job)}
 
-Guidelines:
-- Be specific, not generic
-- Use the STAR method (Situation, Task, Action, Result) for behavioral questions
-- Quantify achievements where possible
-- Focus on Development Economics and research experience
-- Match the tone to the organization (e.g., more formal for UN, slightly less for NGOs)
+## APPLICATION QUESTIONS:
+{questions_text}
 
-Write ONLY the answer, no additional commentary or formatting."""
+Answer every question above following the instructions. Return JSON of the form
+{{"answers": [{{"idx": 1, "answer": "..."}}, ...]}} with one entry per question,
+where "idx" is the question number and "answer" is the plain answer text."""
+    
+    def _build_context_block(self, profile: Dict[str, Any], job: Optional[Job]) -> str:
+        """Format the candidate profile and optional job context."""
+        job_context = ""
+        if job:
+            job_context = f"""
+## JOB CONTEXT:
+Title: {job.title}
+Organization: {job.organization}
+Description: {truncate_text(job.description, _PROMPT_BUDGETS['description']) if job.description else 'Not provided'}
+"""
+        
+        return f"""## CANDIDATE PROFILE:
+Name: {profile.get('name', 'Candidate')}
+Summary: {profile.get('summary', '')}
+Skills: {', '.join(profile.get('skills', []))}
+Education: {truncate_text(profile.get('education', ''), _PROMPT_BUDGETS['education'])}
+Experience: {truncate_text(profile.get('experience', ''), _PROMPT_BUDGETS['experience'])}
+Research Interests: {', '.join(profile.get('research_interests', []))}
+{job_context}"""
     
     def suggest_questions(self, job: Job) -> List[str]:
         """
@@ -196,37 +373,5 @@ Write ONLY the answer, no additional commentary or formatting."""
         Returns:
             List of likely application questions
         """
-        # Common questions for development economics roles
-        common_questions = [
-            "Why are you interested in this position?",
-            "Describe your experience with impact evaluation or research methodology.",
-            "How does your background align with our organization's mission?",
-            "Describe a challenging research project you've worked on and how you overcame obstacles.",
-            "What is your experience working with data analysis tools (Stata, R, Python)?",
-            "Tell us about your experience working in developing countries or cross-cultural settings.",
-            "How do you prioritize tasks when managing multiple projects?",
-            "Describe your experience with policy-relevant research.",
-        ]
-        
-        # Add role-specific questions based on job content
-        description_lower = (job.description or "").lower()
-        
-        if "management" in description_lower or "lead" in description_lower:
-            common_questions.extend([
-                "Describe your experience managing a team or project.",
-                "How do you handle conflicts within a team?",
-            ])
-        
-        if "field" in description_lower or "survey" in description_lower:
-            common_questions.extend([
-                "Describe your experience with field research or data collection.",
-                "How do you ensure data quality in field settings?",
-            ])
-        
-        if "publication" in description_lower or "writing" in description_lower:
-            common_questions.extend([
-                "Describe your publication experience or a paper you've contributed to.",
-                "How do you communicate complex research findings to non-technical audiences?",
-            ])
-        
-        return common_questions[:8]  # Return top 8 most relevant
+        return list(_suggest_from_description((job.description or "").lower()))
+
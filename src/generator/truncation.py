@@ -0,0 +1,46 @@
+"""
+Prompt Text Truncation
+
+Shortens long profile and job fields to a character budget before they
+are embedded in Gemini prompts, cutting at a sentence boundary where
+possible so the kept text still reads cleanly.
+"""
+
+import re
+
+# End of a sentence: terminal punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"[.!?](?=\s)")
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    Truncate text to at most max_chars characters.
+    
+    Prefers to cut after the last complete sentence in the budget, then
+    at the last whitespace; only falls back to a hard cut when neither
+    leaves at least half the budget.
+    
+    Args:
+        text: Text to shorten
+        max_chars: Character budget
+    
+    Returns:
+        The text unchanged if it fits, otherwise a prefix of it
+    """
+    if not text or len(text) <= max_chars:
+        return text
+    
+    head = text[:max_chars]
+    min_keep = max_chars // 2
+    
+    sentence_end = -1
+    for match in _SENTENCE_END.finditer(head):
+        sentence_end = match.end()
+    if sentence_end >= min_keep:
+        return head[:sentence_end]
+    
+    space = head.rfind(" ")
+    if space >= min_keep:
+        return head[:space]
+    
+    return head
@@ -11,10 +11,13 @@ Coordinates all modules to:
 """
 
 import argparse
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from functools import cached_property
 from datetime import datetime
-from pathlib import Path
 from typing import List, Optional
 
 from src.config import get_config, Config
@@ -22,7 +25,9 @@ from src.profile.parser import ProfileParser
 from src.database.db_manager import DatabaseManager, Job
 from src.scrapers.scraper_factory import ScraperFactory
 from src.matching.matcher import JobMatcher, MatchScore
+from src.matching.semantic_cache import SemanticMatchCache
 from src.generator.cover_letter import CoverLetterGenerator
+from src.generator.genai_client import AsyncTokenBucket
 from src.notifications.email_sender import EmailSender
 
 logger = logging.getLogger(__name__)
@@ -64,10 +69,14 @@ class JobApplicationAgent:
         self.config = config or get_config()
         self.config.ensure_directories()
         
+        # Resolve the paths used during a run once
+        self._db_path = self.config.get_absolute_path(self.config.database.path)
+        self._profile_path = self.config.get_absolute_path(self.config.profile.local_path)
+        self._cover_letters_dir = self.config.get_absolute_path(self.config.output.cover_letters_dir)
+        self._cv_path = self.config.get_absolute_path(self.config.email.cv_path)
+        
         # Initialize components
-        self.db = DatabaseManager(
-            str(self.config.get_absolute_path(self.config.database.path))
-        )
+        self.db = DatabaseManager(str(self._db_path))
         
         self.profile_parser = ProfileParser(
             cache_path=str(self.config.get_absolute_path(self.config.profile.cache_file)),
@@ -76,51 +85,72 @@ class JobApplicationAgent:
         
         self.scraper_factory = ScraperFactory(self.config)
         
-        # These require API key, initialized lazily
-        self._matcher: Optional[JobMatcher] = None
-        self._cover_letter_generator: Optional[CoverLetterGenerator] = None
-        self._email_sender: Optional[EmailSender] = None
+        # One limiter for every Gemini caller, so matching and cover letter
+        # requests count against the same per-minute quota
+        self.rate_limiter = AsyncTokenBucket.per_minute(
+            self.config.gemini.requests_per_minute,
+            burst=self.config.gemini.max_concurrency
+        )
     
-    @property
+    # The components below require an API key or credentials and are built
+    # on first access; cached_property then stores them on the instance.
+    # A failed build (e.g. missing API key) raises and is retried next time.
+    
+    @cached_property
     def matcher(self) -> JobMatcher:
         """Lazy initialization of job matcher."""
-        if self._matcher is None:
-            api_key = self.config.get_api_key()
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY not configured")
-            
-            self._matcher = JobMatcher(
-                api_key=api_key,
-                model=self.config.gemini.model,
-                temperature=self.config.gemini.temperature,
-                threshold=self.config.job_search.match_threshold
-            )
-        return self._matcher
+        api_key = self.config.get_api_key()
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not configured")
+        
+        cache_db = self.db if self.config.is_cache_enabled() else None
+        semantic_cache = None
+        if cache_db is not None and self.config.gemini.semantic_cache_model:
+            try:
+                semantic_cache = SemanticMatchCache(
+                    cache_db,
+                    model_name=self.config.gemini.semantic_cache_model,
+                    threshold=self.config.gemini.semantic_cache_threshold,
+                    max_age_days=self.config.gemini.match_cache_ttl_days
+                )
+            except ImportError as e:
+                logger.warning(f"Semantic match cache disabled: {e}")
+        
+        return JobMatcher(
+            api_key=api_key,
+            model=self.config.gemini.model,
+            temperature=self.config.gemini.temperature,
+            threshold=self.config.job_search.match_threshold,
+            top_k=self.config.job_search.top_k,
+            max_concurrency=self.config.gemini.max_concurrency,
+            batch_size=self.config.gemini.match_batch_size,
+            db=cache_db,
+            cache_ttl_days=self.config.gemini.match_cache_ttl_days,
+            rate_limiter=self.rate_limiter,
+            semantic_cache=semantic_cache
+        )
     
-    @property
+    @cached_property
     def cover_letter_generator(self) -> CoverLetterGenerator:
         """Lazy initialization of cover letter generator."""
-        if self._cover_letter_generator is None:
-            api_key = self.config.get_api_key()
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY not configured")
-            
-            self._cover_letter_generator = CoverLetterGenerator(
-                api_key=api_key,
-                model=self.config.gemini.model,
-                temperature=self.config.gemini.temperature,
-                output_dir=str(self.config.get_absolute_path(self.config.output.cover_letters_dir))
-            )
-        return self._cover_letter_generator
+        api_key = self.config.get_api_key()
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not configured")
+        
+        return CoverLetterGenerator(
+            api_key=api_key,
+            model=self.config.gemini.model,
+            temperature=self.config.gemini.temperature,
+            output_dir=str(self._cover_letters_dir),
+            rate_limiter=self.rate_limiter
+        )
     
-    @property
+    @cached_property
     def email_sender(self) -> EmailSender:
         """Lazy initialization of email sender."""
-        if self._email_sender is None:
-            self._email_sender = EmailSender(
-                sender_email=self.config.email.recipient
-            )
-        return self._email_sender
+        return EmailSender(
+            sender_email=self.config.email.recipient
+        )
     
     def run(
         self,
@@ -164,8 +194,14 @@ class JobApplicationAgent:
             profile_data = self.profile_parser.get_profile_for_matching()
             logger.info(f"Profile loaded for: {profile.name}")
             
-            # Step 2: Scrape jobs
-            if not skip_scraping:
+            # Steps 2-3: Scrape jobs and match them. With both steps enabled
+            # they run as one pipeline, so each source's jobs are matched
+            # while slower sources are still being scraped
+            if not skip_scraping and not skip_matching:
+                logger.info("Steps 2-3: Scraping job boards and matching jobs against profile...")
+                matched_jobs = asyncio.run(self._scrape_and_match(profile_data, stats))
+                logger.info(f"Found {stats['jobs_scraped']} jobs, {stats['new_jobs']} new")
+            elif not skip_scraping:
                 logger.info("Step 2: Scraping job boards...")
                 jobs = self._scrape_jobs()
                 stats["jobs_scraped"] = len(jobs)
@@ -177,29 +213,32 @@ class JobApplicationAgent:
                 logger.info("Step 2: Skipping job scraping")
             
             # Step 3: Get unprocessed jobs and match
-            if not skip_matching:
-                logger.info("Step 3: Matching jobs against profile...")
-                unprocessed_jobs = self.db.get_unprocessed_jobs(
-                    limit=self.config.job_search.max_jobs_per_run
-                )
-                logger.info(f"Processing {len(unprocessed_jobs)} unprocessed jobs")
-                
-                matched_jobs = self.matcher.match_jobs(
-                    unprocessed_jobs,
-                    profile_data,
-                    filter_threshold=True
-                )
+            if skip_matching:
+                logger.info("Step 3: Skipping job matching")
+                matched_jobs = []
+            else:
+                if skip_scraping:
+                    logger.info("Step 3: Matching jobs against profile...")
+                    unprocessed_jobs = self.db.get_unprocessed_jobs(
+                        limit=self.config.job_search.max_jobs_per_run
+                    )
+                    logger.info(f"Processing {len(unprocessed_jobs)} unprocessed jobs")
+                    
+                    matched_jobs = self.matcher.match_jobs(
+                        unprocessed_jobs,
+                        profile_data,
+                        filter_threshold=True
+                    )
                 stats["jobs_matched"] = len(matched_jobs)
                 logger.info(f"Found {stats['jobs_matched']} jobs above threshold")
                 
-                # Save match results
-                for job, score in matched_jobs:
-                    match_result = self.matcher.to_match_result(job, score)
-                    self.db.save_match_result(match_result)
-                    self.db.mark_job_processed(job, score.overall)
-            else:
-                logger.info("Step 3: Skipping job matching")
-                matched_jobs = []
+                # Save match results, one transaction per table
+                self.db.save_match_results([
+                    self.matcher.to_match_result(job, score) for job, score in matched_jobs
+                ])
+                self.db.mark_jobs_processed([
+                    (job, score.overall, None) for job, score in matched_jobs
+                ])
             
             # Step 4: Generate cover letters
             if not skip_cover_letters and matched_jobs:
@@ -215,8 +254,8 @@ class JobApplicationAgent:
             # Step 5: Send email notification
             if not skip_email and matched_jobs and not dry_run:
                 logger.info("Step 5: Sending email notification...")
-                cv_path = str(self.config.get_absolute_path(self.config.email.cv_path))
-                if not Path(cv_path).exists():
+                cv_path = str(self._cv_path)
+                if not self._cv_path.exists():
                     cv_path = None
                     logger.warning("CV file not found, email will be sent without CV attachment")
                 
@@ -254,8 +293,7 @@ class JobApplicationAgent:
     
     def _parse_profile(self):
         """Parse user profile from configured source."""
-        profile_path = self.config.get_absolute_path(self.config.profile.local_path)
-        return self.profile_parser.parse(str(profile_path))
+        return self.profile_parser.parse(str(self._profile_path))
     
     def _scrape_jobs(self) -> List[Job]:
         """Scrape jobs from all enabled sources."""
@@ -264,17 +302,101 @@ class JobApplicationAgent:
         
         with self.scraper_factory as factory:
             scrapers = factory.get_enabled_scrapers()
+            if not scrapers:
+                return all_jobs
+            
+            # Each scraper has its own session and rate limit, so the
+            # sources can be fetched side by side
+            results = {}
+            with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+                futures = {}
+                for scraper in scrapers:
+                    logger.info(f"Scraping {scraper.get_name()}...")
+                    futures[executor.submit(scraper.scrape, keywords)] = scraper
+                
+                for future in as_completed(futures):
+                    scraper = futures[future]
+                    try:
+                        jobs = future.result()
+                        results[scraper] = jobs
+                        logger.info(f"Found {len(jobs)} jobs from {scraper.get_name()}")
+                    except Exception as e:
+                        logger.error(f"Error scraping {scraper.get_name()}: {e}")
             
+            # Keep the configured scraper order regardless of finish order
             for scraper in scrapers:
+                all_jobs.extend(results.get(scraper, ()))
+        
+        return all_jobs
+    
+    async def _scrape_and_match(self, profile_data: dict, stats: dict) -> List[tuple]:
+        """
+        Scrape all enabled sources and match their jobs as they arrive.
+        
+        Scrapers run in worker threads; whenever one finishes, its new
+        jobs are saved and handed to the matcher straight away. Once every
+        source is done, the remaining budget of max_jobs_per_run is filled
+        from earlier unprocessed jobs, as the sequential path would
+        (newly scraped jobs are the newest, so they come first).
+        
+        Args:
+            profile_data: Profile dictionary for matching
+            stats: Run statistics; jobs_scraped and new_jobs are updated
+            
+        Returns:
+            List of (job, match_score) tuples above threshold, sorted by score
+        """
+        loop = asyncio.get_running_loop()
+        keywords = self.config.job_search.keywords
+        budget = self.config.job_search.max_jobs_per_run
+        queued_ids = set()
+        match_tasks = []
+        
+        def start_matching(jobs: List[Job]) -> None:
+            nonlocal budget
+            jobs = jobs[:budget]
+            if jobs:
+                budget -= len(jobs)
+                queued_ids.update(job.job_id for job in jobs)
+                match_tasks.append(asyncio.create_task(
+                    self.matcher.match_jobs_async(jobs, profile_data, filter_threshold=True)
+                ))
+        
+        with self.scraper_factory as factory:
+            scrapers = factory.get_enabled_scrapers()
+            
+            async def scrape(executor: ThreadPoolExecutor, scraper) -> List[Job]:
+                logger.info(f"Scraping {scraper.get_name()}...")
                 try:
-                    logger.info(f"Scraping {scraper.get_name()}...")
-                    jobs = scraper.scrape(keywords)
-                    all_jobs.extend(jobs)
-                    logger.info(f"Found {len(jobs)} jobs from {scraper.get_name()}")
+                    jobs = await loop.run_in_executor(executor, scraper.scrape, keywords)
                 except Exception as e:
                     logger.error(f"Error scraping {scraper.get_name()}: {e}")
+                    return []
+                logger.info(f"Found {len(jobs)} jobs from {scraper.get_name()}")
+                return jobs
+            
+            if scrapers:
+                with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+                    for finished in asyncio.as_completed([scrape(executor, s) for s in scrapers]):
+                        jobs = await finished
+                        stats["jobs_scraped"] += len(jobs)
+                        
+                        # Only jobs not stored before are matched here;
+                        # known unprocessed ones are picked up with the backlog
+                        existing = self.db.existing_ids(job.job_id for job in jobs)
+                        new_jobs = list({
+                            job.job_id: job for job in jobs if job.job_id not in existing
+                        }.values())
+                        stats["new_jobs"] += self.db.add_jobs(jobs)
+                        start_matching(new_jobs)
         
-        return all_jobs
+        if budget > 0:
+            backlog = self.db.get_unprocessed_jobs(limit=budget + len(queued_ids))
+            start_matching([job for job in backlog if job.job_id not in queued_ids])
+        logger.info(f"Processing {len(queued_ids)} unprocessed jobs")
+        
+        results = await asyncio.gather(*match_tasks)
+        return self.matcher.rank_matches([match for matched in results for match in matched])
     
     def _generate_cover_letters(
         self,
@@ -283,30 +405,56 @@ class JobApplicationAgent:
     ) -> List[tuple]:
         """Generate cover letters for matched jobs."""
         updated_jobs = []
+        new_letters = []
+        processed = []
+        
+        if not matched_jobs:
+            return updated_jobs
         
+        # Jobs that already have a saved letter skip Gemini entirely
+        cached = {}
+        to_generate = []
         for job, score in matched_jobs:
+            paths = CoverLetterGenerator.cached_paths(job, self.db)
+            if paths:
+                cached[job.job_id] = paths
+            else:
+                to_generate.append((job, score))
+        
+        # Requests to Gemini overlap; files are written as results come back
+        saved = {}
+        if to_generate:
             try:
-                paths = self.cover_letter_generator.generate_and_save(
-                    job=job,
-                    profile=profile_data,
-                    match_score=score
-                )
+                results = asyncio.run(self.cover_letter_generator.generate_and_save_many(
+                    to_generate, profile_data,
+                    concurrency=self.config.gemini.max_concurrency
+                ))
+            except Exception as e:
+                logger.error(f"Error generating cover letters: {e}")
+                results = [e] * len(to_generate)
+            saved = {job.job_id: result for (job, _), result in zip(to_generate, results)}
+        
+        for job, score in matched_jobs:
+            try:
+                is_cached = job.job_id in cached
+                if is_cached:
+                    logger.info(f"Reusing cover letter for {job.title} at {job.organization}")
+                    paths = cached[job.job_id]
+                else:
+                    paths = saved[job.job_id]
+                    if isinstance(paths, BaseException):
+                        raise paths
                 
                 # Add cover letter path to score for email attachment
                 # Prefer .md (editable), fallback to .pdf if generated
                 score.cover_letter_path = paths.get("md") or paths.get("pdf")
                 
-                # Save to database
+                # Queue for the database; written in bulk below
                 if score.cover_letter_path:
-                    self.db.save_cover_letter(
-                        job_id=job.job_id,
-                        content="",  # Content saved in file
-                        file_path=score.cover_letter_path
-                    )
-                    self.db.mark_job_processed(
-                        job, score.overall, 
-                        cover_letter_path=score.cover_letter_path
-                    )
+                    if not is_cached:
+                        # Content saved in file
+                        new_letters.append((job.job_id, "", score.cover_letter_path))
+                    processed.append((job, score.overall, score.cover_letter_path))
                 
                 updated_jobs.append((job, score))
                 
@@ -314,6 +462,18 @@ class JobApplicationAgent:
                 logger.error(f"Error generating cover letter for {job.title}: {e}")
                 updated_jobs.append((job, score))
         
+        try:
+            self.db.save_cover_letters(new_letters)
+            self.db.mark_jobs_processed(processed)
+        except Exception as e:
+            logger.error(f"Error saving cover letter records: {e}")
+        
+        # PDFs are written in the background; make sure they exist before
+        # the summary email goes out. Only flush a generator that was built.
+        generator = self.__dict__.get("cover_letter_generator")
+        if generator is not None:
+            generator.flush()
+        
         return updated_jobs
     
     def get_statistics(self) -> dict:
@@ -369,6 +529,12 @@ def main():
         help="Show database statistics and exit"
     )
     
+    parser.add_argument(
+        "--export-config-json",
+        action="store_true",
+        help="Write the config as JSON next to the YAML file (faster startup) and exit"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -380,9 +546,13 @@ def main():
     # Load configuration
     config = get_config(args.config)
     
+    if args.export_config_json:
+        print(f"Wrote {config.export_json()}")
+        return 0
+    
     # Override log level if verbose
     if args.verbose:
-        config.logging.level = "DEBUG"
+        config.logging = replace(config.logging, level="DEBUG")
     
     # Setup logging
     setup_logging(config)
@@ -5,20 +5,40 @@ Uses Google Gemini to analyze job descriptions against user profile
 and score relevance.
 """
 
+import asyncio
+import hashlib
+import heapq
 import json
 import logging
-from dataclasses import dataclass
+import re
+from bisect import bisect_right
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 
 import google.generativeai as genai
+from google.generativeai.types import generation_types
+from typing_extensions import TypedDict
 
-from src.database.db_manager import Job, MatchResult
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    _json_loads = json.loads
+
+from src.database.db_manager import DatabaseManager, Job, MatchResult
+from src.generator.genai_client import AsyncTokenBucket, get_model
+from src.matching.semantic_cache import SemanticMatchCache
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchScore:
     """Detailed match score breakdown."""
     overall: float
@@ -76,6 +96,107 @@ CITIZENSHIP_REQUIRED_PATTERNS = [
 ]
 
 
+_MATCH_PERSONA = (
+    "You are an expert career advisor specializing in Development Economics "
+    "and Research positions."
+)
+
+# Fields of one match assessment, shared by single and batched prompts
+_SCORE_FIELDS = """    "overall_score": <0-100>,
+    "skills_match": <0-100>,
+    "experience_match": <0-100>,
+    "research_match": <0-100>,
+    "qualification_match": <0-100>,
+    "reasoning": "<2-3 sentence explanation of the match>",
+    "highlights": ["<strength 1>", "<strength 2>", ...],
+    "concerns": ["<gap or concern 1>", "<gap or concern 2>", ...]"""
+
+_SCORE_GUIDELINES = """Score Guidelines:
+- 90-100: Excellent match, candidate exceeds most requirements
+- 80-89: Strong match, candidate meets most requirements
+- 70-79: Good match, candidate meets key requirements
+- 60-69: Moderate match, some gaps but relevant background
+- Below 60: Weak match, significant gaps
+
+Focus on Development Economics, research experience, analytical skills, and relevant qualifications."""
+
+_MAX_MATCH_TOKENS = 2048
+# A batched response holds several (shorter) assessments
+_BATCH_TOKENS_PER_JOB = 1024
+
+
+class _ScoreSchema(TypedDict):
+    """Response schema for one match assessment (see _SCORE_FIELDS)."""
+    overall_score: float
+    skills_match: float
+    experience_match: float
+    research_match: float
+    qualification_match: float
+    reasoning: str
+    highlights: List[str]
+    concerns: List[str]
+
+
+class _BatchScoreSchema(_ScoreSchema):
+    """One assessment in a batched response, tagged with its job number."""
+    idx: int
+
+
+class _BatchResponseSchema(TypedDict):
+    """Response schema for a batched matching request."""
+    matches: List[_BatchScoreSchema]
+
+
+@lru_cache(maxsize=None)
+def _response_schema(schema_cls: type) -> "genai.protos.Schema":
+    """
+    Convert a response schema class to the request Schema once.
+    
+    The SDK would otherwise rebuild it through pydantic on every request.
+    """
+    config = genai.types.GenerationConfig(response_schema=schema_cls)
+    return generation_types.to_generation_config_dict(config)["response_schema"]
+
+# Reason prefix for each pattern list, in the order the lists are checked
+_INELIGIBLE_REASONS = (
+    ("No visa sponsorship", NO_VISA_PATTERNS),
+    ("Citizenship required", CITIZENSHIP_REQUIRED_PATTERNS),
+)
+
+# One compiled alternation per list, used when pyahocorasick is missing
+_INELIGIBLE_REGEXES = tuple(
+    (reason, re.compile("|".join(map(re.escape, patterns))))
+    for reason, patterns in _INELIGIBLE_REASONS
+)
+
+
+def _build_pattern_automaton() -> Optional["ahocorasick.Automaton"]:
+    """
+    Build one Aho-Corasick automaton over every ineligibility pattern.
+    
+    Each pattern is tagged with its (list rank, position, reason) so a
+    single scan can still report the same pattern the list order would.
+    
+    Returns:
+        The automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for rank, (reason, patterns) in enumerate(_INELIGIBLE_REASONS):
+        for position, pattern in enumerate(patterns):
+            # Keep the first tag for a pattern that appears in both lists
+            if pattern not in automaton:
+                automaton.add_word(pattern, (rank, position, reason, pattern))
+    automaton.make_automaton()
+    return automaton
+
+
+_PATTERN_AUTOMATON = _build_pattern_automaton()
+
+
+@lru_cache(maxsize=256)
 def check_visa_eligibility(job_description: str) -> tuple[bool, Optional[str]]:
     """
     Check if a job is eligible for international candidates.
@@ -91,19 +212,90 @@ def check_visa_eligibility(job_description: str) -> tuple[bool, Optional[str]]:
     
     desc_lower = job_description.lower()
     
-    # Check for no visa sponsorship
-    for pattern in NO_VISA_PATTERNS:
-        if pattern in desc_lower:
-            return False, f"No visa sponsorship: '{pattern}' found in description"
+    if _PATTERN_AUTOMATON is not None:
+        # One pass over the text; the earliest pattern in list order wins
+        found = min((tag for _, tag in _PATTERN_AUTOMATON.iter(desc_lower)), default=None)
+        if found is not None:
+            _, _, reason, pattern = found
+            return False, f"{reason}: '{pattern}' found in description"
+        return True, None
     
-    # Check for citizenship requirements
-    for pattern in CITIZENSHIP_REQUIRED_PATTERNS:
-        if pattern in desc_lower:
-            return False, f"Citizenship required: '{pattern}' found in description"
+    for reason, regex in _INELIGIBLE_REGEXES:
+        match = regex.search(desc_lower)
+        if match:
+            return False, f"{reason}: '{match.group(0)}' found in description"
     
     return True, None
 
 
+def check_visa_eligibility_batch(job_descriptions: Sequence[str]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Check many job descriptions in one scan over their combined text.
+    
+    The lowercased descriptions are joined with NUL separators (which no
+    pattern contains, so a match never spans two jobs) and searched once;
+    each match is mapped back to its job by offset.
+    
+    Args:
+        job_descriptions: Job description texts (empty strings allowed)
+        
+    Returns:
+        One (is_eligible, reason_if_not_eligible) tuple per description,
+        the same as check_visa_eligibility() would give
+    """
+    results: List[Tuple[bool, Optional[str]]] = [(True, None)] * len(job_descriptions)
+    if not job_descriptions:
+        return results
+    
+    # Lowercase each description separately: lower() can change a string's
+    # length, and the offsets must match the searched text
+    lowered = [desc.lower() for desc in job_descriptions]
+    starts = []
+    offset = 0
+    for desc in lowered:
+        starts.append(offset)
+        offset += len(desc) + 1
+    text = "\0".join(lowered)
+    
+    if _PATTERN_AUTOMATON is not None:
+        # Keep each job's earliest pattern in list order, as the single check does
+        found = {}
+        for end, tag in _PATTERN_AUTOMATON.iter(text):
+            i = bisect_right(starts, end) - 1
+            if i not in found or tag < found[i]:
+                found[i] = tag
+        for i, (_, _, reason, pattern) in found.items():
+            results[i] = (False, f"{reason}: '{pattern}' found in description")
+        return results
+    
+    # Lists are scanned in order and a job keeps its first hit, so visa
+    # reasons win over citizenship ones and the leftmost match is reported
+    for reason, regex in _INELIGIBLE_REGEXES:
+        for match in regex.finditer(text):
+            i = bisect_right(starts, match.start()) - 1
+            if results[i][0]:
+                results[i] = (False, f"{reason}: '{match.group(0)}' found in description")
+    
+    return results
+
+
+@lru_cache(maxsize=256)
+def _job_details(job: Job) -> str:
+    """
+    Format a job's fields, with the description and requirements truncated.
+    
+    Memoized per job: a job's details appear in its single-job prompt (the
+    cache key) and again in its batched prompt, and Job is frozen, so the
+    truncated text is built once and shared.
+    """
+    return f"""Title: {job.title}
+Organization: {job.organization}
+Location: {job.location}
+Description: {job.description[:3000] if job.description else 'Not provided'}
+Requirements: {job.requirements[:1500] if job.requirements else 'Not provided'}
+Deadline: {job.deadline or 'Not specified'}"""
+
+
 class JobMatcher:
     """
     Matches jobs against user profile using Gemini AI.
@@ -117,7 +309,14 @@ class JobMatcher:
         api_key: str,
         model: str = "gemini-2.0-flash-exp",
         temperature: float = 0.3,
-        threshold: int = 70
+        threshold: int = 70,
+        top_k: int = 0,
+        max_concurrency: int = 8,
+        batch_size: int = 5,
+        db: Optional[DatabaseManager] = None,
+        cache_ttl_days: float = 7,
+        rate_limiter: Optional[AsyncTokenBucket] = None,
+        semantic_cache: Optional[SemanticMatchCache] = None
     ):
         """
         Initialize job matcher.
@@ -127,14 +326,35 @@ class JobMatcher:
             model: Gemini model to use
             temperature: Generation temperature (lower = more deterministic)
             threshold: Minimum score to consider a match
+            top_k: Keep only this many best matches in match_jobs (0 = all)
+            max_concurrency: Maximum Gemini requests in flight in match_jobs
+            batch_size: Jobs scored per request in match_jobs
+            db: Database for caching scores; None disables the cache
+            cache_ttl_days: Rescore a job once its cached score is this old
+            rate_limiter: Optional limiter acquired before each async request
+            semantic_cache: Optional near-duplicate lookup used when the
+                exact cache misses; needs db
         """
         self.threshold = threshold
+        self.top_k = top_k
         self.model_name = model
         self.temperature = temperature
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
+        self.db = db
+        self.cache_ttl_days = cache_ttl_days
+        self.rate_limiter = rate_limiter
+        self.semantic_cache = semantic_cache
+        
+        # Profile section of the last profile seen, reused while the same
+        # profile object is passed in (see _profile_section)
+        self._profile_cache: Optional[Tuple[Dict[str, Any], str]] = None
+        # Request semaphore of the running event loop, shared by concurrent
+        # match_jobs_async calls so together they stay within max_concurrency
+        self._semaphore: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
         
         # Configure Gemini
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        self.model = get_model(api_key, model)
         
         logger.info(f"Initialized JobMatcher with model {model}")
     
@@ -150,31 +370,53 @@ class JobMatcher:
             MatchScore with detailed breakdown
         """
         prompt = self._build_matching_prompt(job, profile)
+        cached = self._cached_score(job, profile, prompt)
+        if cached is not None:
+            return cached
         
         try:
             response = self.model.generate_content(
                 prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=self.temperature,
-                    max_output_tokens=2048,
-                )
+                generation_config=self._generation_config()
             )
             
             # Parse the response
-            return self._parse_match_response(response.text)
+            score = self._parse_match_response(response.text)
+            self._cache_score(job, profile, prompt, score)
+            return score
             
         except Exception as e:
-            logger.error(f"Error matching job {job.title}: {e}")
-            return MatchScore(
-                overall=0,
-                skills_match=0,
-                experience_match=0,
-                research_match=0,
-                qualification_match=0,
-                reasoning=f"Error during matching: {str(e)}",
-                highlights=[],
-                concerns=[]
+            return self._error_score(job, e)
+    
+    async def match_job_async(self, job: Job, profile: Dict[str, Any]) -> MatchScore:
+        """
+        Match a single job against the user profile without blocking.
+        
+        Args:
+            job: Job to match
+            profile: User profile dictionary
+            
+        Returns:
+            MatchScore with detailed breakdown
+        """
+        prompt = self._build_matching_prompt(job, profile)
+        cached = self._cached_score(job, profile, prompt)
+        if cached is not None:
+            return cached
+        
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=self._generation_config()
             )
+            score = self._parse_match_response(response.text)
+            self._cache_score(job, profile, prompt, score)
+            return score
+            
+        except Exception as e:
+            return self._error_score(job, e)
     
     def match_jobs(
         self,
@@ -193,114 +435,361 @@ class JobMatcher:
         Returns:
             List of (job, match_score) tuples, sorted by score
         """
-        results = []
-        filtered_count = 0
+        return asyncio.run(self.match_jobs_async(jobs, profile, filter_threshold))
+    
+    async def match_jobs_async(
+        self,
+        jobs: List[Job],
+        profile: Dict[str, Any],
+        filter_threshold: bool = True
+    ) -> List[tuple]:
+        """
+        Async version of match_jobs, for callers already in an event loop.
+        
+        Concurrent calls share the max_concurrency request limit, so jobs
+        can be matched in several groups as they arrive.
         
-        for i, job in enumerate(jobs):
-            logger.info(f"Matching job {i+1}/{len(jobs)}: {job.title}")
+        Args:
+            jobs: List of jobs to match
+            profile: User profile dictionary
+            filter_threshold: If True, only return jobs above threshold
             
-            # Check visa/citizenship eligibility first
-            is_eligible, filter_reason = check_visa_eligibility(job.description or "")
+        Returns:
+            List of (job, match_score) tuples, sorted by score
+        """
+        # Check visa/citizenship eligibility first, for all jobs in one pass
+        eligibility = check_visa_eligibility_batch([job.description or "" for job in jobs])
+        eligible = []
+        filtered_count = 0
+        for job, (is_eligible, filter_reason) in zip(jobs, eligibility):
             if not is_eligible:
                 logger.info(f"Filtered out (visa/citizenship): {job.title} - {filter_reason}")
                 filtered_count += 1
                 continue
-            
-            score = self.match_job(job, profile)
-            
+            eligible.append(job)
+        
+        scores = await self._match_jobs_async(eligible, profile) if eligible else []
+        
+        results = []
+        for job, score in zip(eligible, scores):
             if filter_threshold and score.overall < self.threshold:
                 logger.debug(f"Job below threshold ({score.overall}): {job.title}")
                 continue
             
             results.append((job, score))
         
-        # Sort by overall score descending
-        results.sort(key=lambda x: x[1].overall, reverse=True)
+        results = self.rank_matches(results)
         
         logger.info(f"Matched {len(results)} jobs above threshold {self.threshold}")
         if filtered_count > 0:
             logger.info(f"Filtered out {filtered_count} jobs due to visa/citizenship requirements")
         return results
     
+    def rank_matches(self, results: List[tuple]) -> List[tuple]:
+        """
+        Sort (job, match_score) tuples by score, keeping at most top_k.
+        
+        Also used to merge the results of several match_jobs_async calls.
+        
+        Args:
+            results: (job, match_score) tuples in any order
+            
+        Returns:
+            The best results, sorted by overall score descending
+        """
+        # With a cap, only the best top_k need ordering
+        if 0 < self.top_k < len(results):
+            return heapq.nlargest(self.top_k, results, key=lambda x: x[1].overall)
+        return sorted(results, key=lambda x: x[1].overall, reverse=True)
+    
+    async def _match_jobs_async(
+        self,
+        jobs: List[Job],
+        profile: Dict[str, Any]
+    ) -> List[MatchScore]:
+        """
+        Match jobs in batches, at most max_concurrency requests at a time.
+        
+        Jobs with a cached score are skipped; the rest are split into
+        batches of batch_size, each scored with one request.
+        
+        Args:
+            jobs: Jobs that passed the eligibility filter
+            profile: User profile dictionary
+            
+        Returns:
+            One MatchScore per job, in input order
+        """
+        prompts = [self._build_matching_prompt(job, profile) for job in jobs]
+        scores: List[Optional[MatchScore]] = [
+            self._cached_score(job, profile, prompt) for job, prompt in zip(jobs, prompts)
+        ]
+        pending = [i for i, score in enumerate(scores) if score is None]
+        batches = [
+            pending[start:start + self.batch_size]
+            for start in range(0, len(pending), self.batch_size)
+        ]
+        
+        semaphore = self._request_semaphore()
+        if pending:
+            logger.info(f"Matching {len(pending)} jobs ({len(jobs) - len(pending)} cached)")
+        
+        # Progress is logged at INFO about every 10% of jobs; per-batch
+        # titles only at DEBUG, so large runs don't flood the log
+        progress_step = max(1, len(pending) // 10)
+        done = logged = 0
+        
+        async def bounded(batch: List[int]) -> List[MatchScore]:
+            nonlocal done, logged
+            async with semaphore:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Matching job(s) {batch[0]+1}-{batch[-1]+1}/{len(jobs)}: "
+                        f"{', '.join(jobs[i].title for i in batch)}"
+                    )
+                try:
+                    return await self._match_batch_async(
+                        [jobs[i] for i in batch], [prompts[i] for i in batch], profile
+                    )
+                finally:
+                    done += len(batch)
+                    if done - logged >= progress_step or done == len(pending):
+                        logged = done
+                        logger.info(f"Matched {done}/{len(pending)} jobs")
+        
+        outcomes = await asyncio.gather(
+            *(bounded(batch) for batch in batches),
+            return_exceptions=True
+        )
+        
+        # A failure in one batch must not drop the rest
+        for batch, outcome in zip(batches, outcomes):
+            for position, i in enumerate(batch):
+                if isinstance(outcome, BaseException):
+                    scores[i] = self._error_score(jobs[i], outcome)
+                else:
+                    scores[i] = outcome[position]
+        return scores
+    
+    async def _match_batch_async(
+        self,
+        jobs: List[Job],
+        prompts: List[str],
+        profile: Dict[str, Any]
+    ) -> List[MatchScore]:
+        """
+        Score a batch of jobs with one request, falling back to one per job.
+        
+        Args:
+            jobs: Jobs to score
+            prompts: Single-job matching prompt for each job (cache keys)
+            profile: User profile dictionary
+            
+        Returns:
+            One MatchScore per job, in input order
+        """
+        if len(jobs) > 1:
+            try:
+                scores = await self._score_batch_async(jobs, profile)
+                for job, prompt, score in zip(jobs, prompts, scores):
+                    self._cache_score(job, profile, prompt, score)
+                return scores
+            except Exception as e:
+                logger.warning(f"Batched matching failed, matching {len(jobs)} jobs one by one: {e}")
+        
+        return [await self.match_job_async(job, profile) for job in jobs]
+    
+    async def _score_batch_async(self, jobs: List[Job], profile: Dict[str, Any]) -> List[MatchScore]:
+        """
+        Score several jobs with a single JSON-mode request.
+        
+        Raises:
+            ValueError: If the response is missing a score for any job
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        response = await self.model.generate_content_async(
+            self._build_batched_prompt(jobs, profile),
+            generation_config=genai.types.GenerationConfig(
+                temperature=self.temperature,
+                max_output_tokens=_BATCH_TOKENS_PER_JOB * len(jobs),
+                response_mime_type="application/json",
+                response_schema=_response_schema(_BatchResponseSchema),
+            )
+        )
+        
+        scores = {
+            int(item["idx"]): self._score_from_data(item)
+            for item in _json_loads(response.text)["matches"]
+        }
+        missing = [idx for idx in range(1, len(jobs) + 1) if idx not in scores]
+        if missing:
+            raise ValueError(f"No score for job(s) {missing}")
+        
+        return [scores[idx] for idx in range(1, len(jobs) + 1)]
+    
+    def _request_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent requests in the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
+    
+    def _generation_config(self) -> genai.types.GenerationConfig:
+        """Generation settings shared by sync and async matching."""
+        return genai.types.GenerationConfig(
+            temperature=self.temperature,
+            max_output_tokens=_MAX_MATCH_TOKENS,
+            response_mime_type="application/json",
+            response_schema=_response_schema(_ScoreSchema),
+        )
+    
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Hash the model name and prompt into a match cache key.
+        
+        The prompt embeds every job and profile field the score depends
+        on, so any change to them (or to the prompt itself) misses the cache.
+        """
+        return hashlib.sha256(f"{self.model_name}\n{prompt}".encode("utf-8")).hexdigest()
+    
+    def _context_key(self, profile: Dict[str, Any]) -> str:
+        """Hash the model name and profile section; scores only carry over within one context."""
+        return hashlib.sha256(
+            f"{self.model_name}\n{self._profile_section(profile)}".encode("utf-8")
+        ).hexdigest()
+    
+    def _cached_score(self, job: Job, profile: Dict[str, Any], prompt: str) -> Optional[MatchScore]:
+        """Return a cached score for this prompt (or a near-duplicate job), if caching is enabled."""
+        if self.db is None:
+            return None
+        
+        cached = self.db.get_cached_match(self._cache_key(prompt), self.cache_ttl_days)
+        if cached is None and self.semantic_cache is not None:
+            similar_key = self.semantic_cache.lookup(self._context_key(profile), job)
+            if similar_key is not None:
+                cached = self.db.get_cached_match(similar_key, self.cache_ttl_days)
+        if cached is None:
+            return None
+        
+        logger.debug(f"Using cached match score for {job.title}")
+        return MatchScore(**_json_loads(cached))
+    
+    def _cache_score(self, job: Job, profile: Dict[str, Any], prompt: str, score: MatchScore) -> None:
+        """Store a successful score for later runs, if caching is enabled."""
+        if self.db is None:
+            return
+        
+        cache_key = self._cache_key(prompt)
+        self.db.cache_match(cache_key, json.dumps(asdict(score)))
+        if self.semantic_cache is not None:
+            self.semantic_cache.add(self._context_key(profile), job, cache_key)
+    
+    def _error_score(self, job: Job, error: BaseException) -> MatchScore:
+        """Zero score recorded when matching a job fails."""
+        logger.error(f"Error matching job {job.title}: {error}")
+        return MatchScore(
+            overall=0,
+            skills_match=0,
+            experience_match=0,
+            research_match=0,
+            qualification_match=0,
+            reasoning=f"Error during matching: {str(error)}",
+            highlights=[],
+            concerns=[]
+        )
+    
     def _build_matching_prompt(self, job: Job, profile: Dict[str, Any]) -> str:
         """Build the prompt for job matching."""
-        return f"""You are an expert career advisor specializing in Development Economics and Research positions.
+        return f"""{_MATCH_PERSONA}
 
 Analyze how well this candidate matches the job posting and provide a detailed assessment.
 
-## CANDIDATE PROFILE:
-Name: {profile.get('name', 'Candidate')}
-Summary: {profile.get('summary', 'Not provided')}
-Skills: {', '.join(profile.get('skills', []))}
-Education: {profile.get('education', 'Not provided')}
-Experience: {profile.get('experience', 'Not provided')}
-Research Interests: {', '.join(profile.get('research_interests', []))}
-Years of Experience: {profile.get('years_of_experience', 'Unknown')}
+{self._profile_section(profile)}
 
-## JOB POSTING:
-Title: {job.title}
-Organization: {job.organization}
-Location: {job.location}
-Description: {job.description[:3000] if job.description else 'Not provided'}
-Requirements: {job.requirements[:1500] if job.requirements else 'Not provided'}
-Deadline: {job.deadline or 'Not specified'}
+{self._job_section(job, "JOB POSTING")}
 
 ## INSTRUCTIONS:
 Evaluate the match and respond with a JSON object (no markdown formatting) containing:
 {{
-    "overall_score": <0-100>,
-    "skills_match": <0-100>,
-    "experience_match": <0-100>,
-    "research_match": <0-100>,
-    "qualification_match": <0-100>,
-    "reasoning": "<2-3 sentence explanation of the match>",
-    "highlights": ["<strength 1>", "<strength 2>", ...],
-    "concerns": ["<gap or concern 1>", "<gap or concern 2>", ...]
+{_SCORE_FIELDS}
 }}
 
-Score Guidelines:
-- 90-100: Excellent match, candidate exceeds most requirements
-- 80-89: Strong match, candidate meets most requirements
-- 70-79: Good match, candidate meets key requirements
-- 60-69: Moderate match, some gaps but relevant background
-- Below 60: Weak match, significant gaps
-
-Focus on Development Economics, research experience, analytical skills, and relevant qualifications.
+{_SCORE_GUIDELINES}
 Respond ONLY with the JSON object, no other text."""
     
+    def _build_batched_prompt(self, jobs: List[Job], profile: Dict[str, Any]) -> str:
+        """Build one prompt asking for a JSON assessment of every job."""
+        job_sections = "\n\n".join(
+            self._job_section(job, f"JOB {idx}") for idx, job in enumerate(jobs, start=1)
+        )
+        
+        return f"""{_MATCH_PERSONA}
+
+Analyze how well this candidate matches each of the {len(jobs)} job postings below and provide a detailed assessment of each.
+
+{self._profile_section(profile)}
+
+{job_sections}
+
+## INSTRUCTIONS:
+Evaluate each job on its own. Return JSON of the form {{"matches": [...]}} with
+one object per job, where "idx" is the job number:
+{{
+    "idx": <job number>,
+{_SCORE_FIELDS}
+}}
+
+{_SCORE_GUIDELINES}"""
+    
+    def _profile_section(self, profile: Dict[str, Any]) -> str:
+        """Format the candidate profile for a matching prompt, cached per profile object."""
+        cached = self._profile_cache
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+        
+        section = f"""## CANDIDATE PROFILE:
+Name: {profile.get('name', 'Candidate')}
+Summary: {profile.get('summary', 'Not provided')}
+Skills: {', '.join(profile.get('skills', []))}
+Education: {profile.get('education', 'Not provided')}
+Experience: {profile.get('experience', 'Not provided')}
+Research Interests: {', '.join(profile.get('research_interests', []))}
+Years of Experience: {profile.get('years_of_experience', 'Unknown')}"""
+        self._profile_cache = (profile, section)
+        return section
+    
+    def _job_section(self, job: Job, heading: str) -> str:
+        """Format one job posting for a matching prompt."""
+        return f"## {heading}:\n{_job_details(job)}"
+    
     def _parse_match_response(self, response_text: str) -> MatchScore:
         """Parse the Gemini response into a MatchScore."""
+        # Requests use JSON mode with a response schema, so the text is bare
+        # JSON with the expected fields; the free-text fallback is last-ditch
         try:
-            # Clean up response - remove any markdown formatting
-            text = response_text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
-            
-            data = json.loads(text)
-            
-            return MatchScore(
-                overall=float(data.get("overall_score", 0)),
-                skills_match=float(data.get("skills_match", 0)),
-                experience_match=float(data.get("experience_match", 0)),
-                research_match=float(data.get("research_match", 0)),
-                qualification_match=float(data.get("qualification_match", 0)),
-                reasoning=data.get("reasoning", ""),
-                highlights=data.get("highlights", []),
-                concerns=data.get("concerns", [])
-            )
+            return self._score_from_data(_json_loads(response_text))
             
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse match response as JSON: {e}")
             # Try to extract score from text
             return self._extract_score_from_text(response_text)
     
+    def _score_from_data(self, data: Dict[str, Any]) -> MatchScore:
+        """Build a MatchScore from one parsed JSON assessment."""
+        return MatchScore(
+            overall=float(data.get("overall_score", 0)),
+            skills_match=float(data.get("skills_match", 0)),
+            experience_match=float(data.get("experience_match", 0)),
+            research_match=float(data.get("research_match", 0)),
+            qualification_match=float(data.get("qualification_match", 0)),
+            reasoning=data.get("reasoning", ""),
+            highlights=data.get("highlights", []),
+            concerns=data.get("concerns", [])
+        )
+    
     def _extract_score_from_text(self, text: str) -> MatchScore:
         """Fallback: extract score from unstructured text."""
-        import re
-        
         # Try to find a score pattern
         score_match = re.search(r'(\d{1,3})\s*(?:/\s*100|%|points?)', text)
         if score_match:
@@ -0,0 +1,129 @@
+"""
+Semantic Match Cache
+
+Reuses match scores for near-duplicate postings: the same role reposted
+with a reworded title or description misses the exact prompt-hash cache,
+but its embedding lands next to the one already scored.
+
+Requires the optional sentence-transformers package (which brings numpy).
+"""
+
+import logging
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from src.database.db_manager import DatabaseManager, Job
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # sentence-transformers is optional
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+# Characters of the description embedded along with the title
+_EMBED_DESCRIPTION_CHARS = 512
+
+
+class SemanticMatchCache:
+    """
+    Nearest-neighbour lookup of previously scored jobs.
+    
+    Embeddings are stored in the database next to the match cache entry
+    they point to, grouped by a context key (model and profile), since a
+    score only carries over to a similar job for the same candidate.
+    Each context's embeddings are loaded into one normalized matrix on
+    first use, so a lookup is a single matrix-vector product.
+    """
+    
+    def __init__(
+        self,
+        db: DatabaseManager,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.95,
+        max_age_days: float = 7
+    ):
+        """
+        Initialize the cache and load the embedding model.
+        
+        Args:
+            db: Database holding the embeddings and match cache
+            model_name: sentence-transformers model to embed jobs with
+            threshold: Minimum cosine similarity to reuse a score
+            max_age_days: Ignore embeddings older than this many days
+        
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        if SentenceTransformer is None:
+            raise ImportError("sentence-transformers is required for the semantic match cache")
+        
+        self.db = db
+        self.threshold = threshold
+        self.max_age_days = max_age_days
+        self.embedder = SentenceTransformer(model_name)
+        
+        # context key -> (match cache keys, embedding matrix), row-aligned
+        self._indexes: Dict[str, Tuple[List[str], "np.ndarray"]] = {}
+        # A lookup miss is followed by add() for the same job once it has
+        # been scored; memoize so each job is embedded once
+        self._embed = lru_cache(maxsize=256)(self._embed)
+        
+        logger.info(f"Initialized semantic match cache with model {model_name}")
+    
+    def lookup(self, context_key: str, job: Job) -> Optional[str]:
+        """
+        Find the most similar previously scored job.
+        
+        Args:
+            context_key: Model/profile context the score must come from
+            job: Job about to be scored
+        
+        Returns:
+            Match cache key of a job at least `threshold` similar, or None
+        """
+        keys, matrix = self._index(context_key)
+        if not keys:
+            return None
+        
+        similarities = matrix @ self._embed(job)
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        
+        logger.debug(f"Found near-duplicate of {job.title} (similarity {similarities[best]:.3f})")
+        return keys[best]
+    
+    def add(self, context_key: str, job: Job, cache_key: str) -> None:
+        """
+        Record a newly scored job.
+        
+        Args:
+            context_key: Model/profile context the score was made in
+            job: Job that was scored
+            cache_key: Match cache key its score is stored under
+        """
+        embedding = self._embed(job)
+        self.db.save_match_embedding(cache_key, context_key, embedding.tobytes())
+        
+        keys, matrix = self._index(context_key)
+        self._indexes[context_key] = (keys + [cache_key], np.vstack([matrix, embedding]))
+    
+    def _embed(self, job: Job) -> "np.ndarray":
+        """Normalized float32 embedding of a job's title and description."""
+        text = f"{job.title} {(job.description or '')[:_EMBED_DESCRIPTION_CHARS]}"
+        return self.embedder.encode(text, normalize_embeddings=True).astype(np.float32)
+    
+    def _index(self, context_key: str) -> Tuple[List[str], "np.ndarray"]:
+        """Load (once) the stored embeddings for a context."""
+        index = self._indexes.get(context_key)
+        if index is None:
+            rows = self.db.get_match_embeddings(context_key, self.max_age_days)
+            dimension = self.embedder.get_sentence_embedding_dimension()
+            matrix = np.empty((len(rows), dimension), dtype=np.float32)
+            for i, (_, blob) in enumerate(rows):
+                matrix[i] = np.frombuffer(blob, dtype=np.float32)
+            index = ([cache_key for cache_key, _ in rows], matrix)
+            self._indexes[context_key] = index
+        return index
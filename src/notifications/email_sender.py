@@ -5,21 +5,37 @@ Sends job match notifications via Gmail API with
 attachments for cover letters and CV.
 """
 
-import base64
 import logging
 import mimetypes
 import os
-from datetime import datetime
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.charset import Charset, QP
+from email.generator import BytesGenerator
+from email.header import Header
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
 
+try:
+    import pybase64 as _b64  # SIMD base64, same API as the stdlib module
+except ImportError:  # pybase64 is optional
+    import base64 as _b64
+
+from httplib2 import HttpLib2Error
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from tenacity import retry, retry_if_exception, stop_after_attempt
+from google.auth.exceptions import GoogleAuthError
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from src.database.db_manager import Job
 from src.matching.matcher import MatchScore
@@ -29,6 +45,173 @@ logger = logging.getLogger(__name__)
 # Gmail API scopes
 SCOPES = ['https://www.googleapis.com/auth/gmail.send']
 
+# Summary email templates; compiled once on first use and reused, since
+# auto_reload is off. Only the HTML template is autoescaped.
+_TEMPLATES = Environment(
+    loader=FileSystemLoader(Path(__file__).resolve().parents[2] / "templates"),
+    autoescape=select_autoescape(enabled_extensions=("html.j2",), default_for_string=False),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+
+# Refresh the OAuth token when it expires within this window, before a
+# send rather than in the middle of one
+_TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Sends rejected with these statuses (rate limited, temporarily
+# unavailable) are retried, waiting for Retry-After when Gmail sends one
+# and backing off exponentially (1s, 2s, 4s, ...) otherwise
+_RETRY_STATUSES = frozenset({429, 500, 503})
+_SEND_ATTEMPTS = 6
+_MAX_RETRY_WAIT = 47
+
+# Errors a send can fail with: API, transport, auth and attachment I/O
+_SEND_ERRORS = (HttpError, HttpLib2Error, GoogleAuthError, OSError, ValueError)
+
+# Text bodies go out as 7bit when pure ASCII with lines short enough for
+# RFC 5322, otherwise as UTF-8 quoted-printable, which stays close to the
+# original size for mostly-ASCII text where base64 adds a third
+_MAX_7BIT_LINE = 998
+_UTF8_QP = Charset('utf-8')
+_UTF8_QP.body_encoding = QP
+
+# Maximum attachments read and encoded at the same time
+_MAX_ATTACHMENT_WORKERS = 8
+
+# Maximum requests Gmail accepts in one batch HTTP call
+MAX_BATCH_SIZE = 100
+
+# Bytes encoded per step when streaming base64: a multiple of 57, so each
+# step of encodebytes() ends on a full 76-character line (and, being a
+# multiple of 3, leaves no partial group)
+_BASE64_CHUNK = 57 * 1024
+
+
+class _Base64Writer:
+    """
+    Write-only file object that URL-safe base64 encodes what it receives.
+    
+    Lets a BytesGenerator flatten a message straight into its encoded
+    form, so the unencoded message is never held in memory in full.
+    """
+    
+    def __init__(self):
+        self._pending = bytearray()
+        self._encoded = bytearray()
+    
+    def write(self, data: bytes) -> int:
+        self._pending += data
+        if len(self._pending) >= _BASE64_CHUNK:
+            # Encode whole 3-byte groups only, keeping the rest for later
+            size = len(self._pending) - len(self._pending) % 3
+            self._encoded += _b64.urlsafe_b64encode(self._pending[:size])
+            del self._pending[:size]
+        return len(data)
+    
+    def getvalue(self) -> str:
+        """Encode whatever is left and return the full encoded text."""
+        self._encoded += _b64.urlsafe_b64encode(self._pending)
+        self._pending.clear()
+        return self._encoded.decode('ascii')
+
+
+@lru_cache(maxsize=4)
+def _load_service(credentials_path: str, token_path: str) -> Tuple[Credentials, Any]:
+    """
+    Authenticate with the Gmail API and build the service client.
+    
+    Cached, so every EmailSender using the same credential files shares
+    one client instead of repeating token I/O and client construction.
+    
+    Returns:
+        Tuple of (credentials, Gmail service)
+    """
+    creds = None
+    
+    # Load existing token
+    if os.path.exists(token_path):
+        try:
+            creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+        except Exception as e:
+            logger.warning(f"Failed to load token: {e}")
+    
+    # Refresh or get new credentials
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            try:
+                creds.refresh(Request())
+            except Exception as e:
+                logger.warning(f"Failed to refresh token: {e}")
+                creds = None
+        
+        if not creds:
+            if not os.path.exists(credentials_path):
+                raise FileNotFoundError(
+                    f"Gmail credentials not found at {credentials_path}. "
+                    "Please set up OAuth credentials in Google Cloud Console."
+                )
+            
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_path, SCOPES
+            )
+            creds = flow.run_local_server(port=0)
+        
+        _save_token(creds, token_path)
+    
+    # The Gmail discovery document ships with the client library, so
+    # no network fetch (or discovery cache) is needed to build
+    service = build(
+        'gmail', 'v1', credentials=creds,
+        static_discovery=True, cache_discovery=False
+    )
+    logger.info("Gmail API authenticated successfully")
+    return creds, service
+
+
+def _save_token(creds: Credentials, token_path: str) -> None:
+    """Write the OAuth token atomically, so a crash can't leave it truncated."""
+    tmp_path = f"{token_path}.tmp"
+    with open(tmp_path, 'w') as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+
+def _body_charset(content: str) -> Union[str, Charset]:
+    """Charset for a text body: us-ascii (sent as 7bit) if possible, else UTF-8 quoted-printable."""
+    if content.isascii() and all(len(line) <= _MAX_7BIT_LINE for line in content.splitlines()):
+        return 'us-ascii'
+    return _UTF8_QP
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether a failed send is worth retrying."""
+    return isinstance(error, HttpError) and error.resp.status in _RETRY_STATUSES
+
+
+def _retry_delay(error: HttpError, attempt: int) -> float:
+    """Seconds to wait before retrying a send that failed on the given attempt."""
+    try:
+        delay = float(error.resp.get('retry-after'))
+    except (TypeError, ValueError):  # absent, or an HTTP date
+        delay = 2 ** (attempt - 1)
+    return min(delay, _MAX_RETRY_WAIT)
+
+
+@retry(
+    stop=stop_after_attempt(_SEND_ATTEMPTS),
+    wait=lambda retry_state: _retry_delay(retry_state.outcome.exception(), retry_state.attempt_number),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+    before_sleep=lambda retry_state: logger.warning(
+        f"Gmail send failed ({retry_state.outcome.exception().resp.status}), "
+        f"retrying ({retry_state.attempt_number}/{_SEND_ATTEMPTS})..."
+    )
+)
+def _execute_send(request: Any) -> Any:
+    """Execute a Gmail send request, retrying rate-limited attempts."""
+    return request.execute()
+
 
 class EmailSender:
     """
@@ -54,52 +237,55 @@ class EmailSender:
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.sender_email = sender_email
-        self.service = None
         
-        self._authenticate()
+        # Set by _authenticate on first use of creds or service, so an
+        # instance that never sends never touches the token or Gmail
+        self._creds: Optional[Credentials] = None
+        self._service = None
+        
+        # Encoded attachment payloads by (path, mtime, size), so a file
+        # attached to several emails (e.g. the CV in a batch) is read and
+        # encoded once while it is unchanged
+        self._attachment_cache: Dict[Tuple[str, float, int], str] = {}
+    
+    @property
+    def creds(self) -> Credentials:
+        """OAuth credentials, authenticating on first access."""
+        if self._creds is None:
+            self._authenticate()
+        return self._creds
+    
+    @property
+    def service(self):
+        """Gmail service client, authenticating on first access."""
+        if self._service is None:
+            self._authenticate()
+        return self._service
     
     def _authenticate(self) -> None:
         """Authenticate with Gmail API."""
-        creds = None
+        self._creds, self._service = _load_service(self.credentials_path, self.token_path)
+    
+    def _maybe_refresh(self) -> None:
+        """Refresh the OAuth token ahead of a send if it is about to expire."""
+        creds = self.creds
+        if not creds or not creds.expiry or not creds.refresh_token:
+            return
         
-        # Load existing token
-        if os.path.exists(self.token_path):
-            try:
-                creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
-            except Exception as e:
-                logger.warning(f"Failed to load token: {e}")
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if creds.expiry - now >= _TOKEN_REFRESH_MARGIN:
+            return
         
-        # Refresh or get new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                except Exception as e:
-                    logger.warning(f"Failed to refresh token: {e}")
-                    creds = None
-            
-            if not creds:
-                if not os.path.exists(self.credentials_path):
-                    raise FileNotFoundError(
-                        f"Gmail credentials not found at {self.credentials_path}. "
-                        "Please set up OAuth credentials in Google Cloud Console."
-                    )
-                
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-            
-            # Save the token
-            with open(self.token_path, 'w') as token:
-                token.write(creds.to_json())
-        
-        self.service = build('gmail', 'v1', credentials=creds)
-        logger.info("Gmail API authenticated successfully")
+        try:
+            creds.refresh(Request())
+            _save_token(creds, self.token_path)
+        except Exception as e:
+            logger.warning(f"Failed to refresh token: {e}")
     
     def send_job_summary(
         self,
-        recipient: str,
+        recipient: Union[str, List[str]],
         matched_jobs: List[tuple],
         cv_path: Optional[str] = None,
         include_cover_letters: bool = False  # Changed default to False
@@ -108,45 +294,87 @@ class EmailSender:
         Send daily summary email with matched jobs.
         
         Args:
-            recipient: Email recipient
+            recipient: Email recipient, or a list of recipients who each
+                get their own copy (sent in one batch request)
             matched_jobs: List of (Job, MatchScore) tuples
             cv_path: Optional path to CV file
             include_cover_letters: Whether to attach cover letters (default False)
             
         Returns:
-            True if sent successfully
+            True if sent successfully (to every recipient)
         """
         if not matched_jobs:
             logger.info("No matched jobs to send")
             return False
         
-        # Build email content - compact summary format
-        subject = f"🎯 Job Matches Found - {datetime.now().strftime('%B %d, %Y')} ({len(matched_jobs)} jobs)"
+        content = self._summary_content(matched_jobs, cv_path)
         
-        html_content = self._build_summary_html(matched_jobs)
-        text_content = self._build_summary_text(matched_jobs)
+        if isinstance(recipient, str):
+            return self.send_email(recipient=recipient, **content)
         
-        # No attachments by default - cover letters saved locally as .md files
-        attachments = []
+        return all(self.send_emails_batch([
+            {'recipient': address, **content} for address in recipient
+        ]))
+    
+    def send_job_summary_multi(
+        self,
+        recipients: List[str],
+        matched_jobs: List[tuple],
+        cv_path: Optional[str] = None
+    ) -> bool:
+        """
+        Send one summary email to several recipients, as BCC.
         
-        if cv_path and os.path.exists(cv_path):
-            attachments.append(cv_path)
+        Unlike send_job_summary with a list of recipients, the message is
+        built, encoded and sent once; Gmail fans it out.
         
+        Args:
+            recipients: Email recipients
+            matched_jobs: List of (Job, MatchScore) tuples
+            cv_path: Optional path to CV file
+            
+        Returns:
+            True if sent successfully
+        """
+        if not matched_jobs or not recipients:
+            logger.info("No matched jobs or recipients to send to")
+            return False
+        
+        # Addressed to the sender (or the first recipient if no sender is
+        # configured); everyone else only appears in the stripped Bcc header
+        to = self.sender_email or recipients[0]
         return self.send_email(
-            recipient=recipient,
-            subject=subject,
-            html_content=html_content,
-            text_content=text_content,
-            attachments=attachments
+            recipient=to,
+            bcc=[address for address in recipients if address != to],
+            **self._summary_content(matched_jobs, cv_path)
         )
     
+    def _summary_content(self, matched_jobs: List[tuple], cv_path: Optional[str]) -> Dict[str, Any]:
+        """Subject, bodies and attachments of the summary email, as send_email arguments."""
+        # Build email content - compact summary format; one timestamp for
+        # the whole email, so subject and body dates agree
+        now = datetime.now()
+        subject = f"🎯 Job Matches Found - {now.strftime('%B %d, %Y')} ({len(matched_jobs)} jobs)"
+        
+        # No attachments by default - cover letters saved locally as .md files.
+        # A missing CV is skipped when the attachment is created.
+        attachments = [cv_path] if cv_path else []
+        
+        return {
+            'subject': subject,
+            'html_content': self._build_summary_html(matched_jobs, now),
+            'text_content': self._build_summary_text(matched_jobs, now),
+            'attachments': attachments,
+        }
+    
     def send_email(
         self,
         recipient: str,
         subject: str,
         html_content: str,
         text_content: Optional[str] = None,
-        attachments: Optional[List[str]] = None
+        attachments: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
     ) -> bool:
         """
         Send an email via Gmail API.
@@ -157,48 +385,215 @@ class EmailSender:
             html_content: HTML body
             text_content: Plain text body (fallback)
             attachments: List of file paths to attach
+            bcc: Optional blind copy recipients
             
         Returns:
             True if sent successfully
         """
         try:
-            message = MIMEMultipart('mixed')
-            message['to'] = recipient
-            message['from'] = self.sender_email or 'me'
-            message['subject'] = subject
-            
-            # Create body part
-            body = MIMEMultipart('alternative')
-            
-            if text_content:
-                body.attach(MIMEText(text_content, 'plain'))
-            
-            body.attach(MIMEText(html_content, 'html'))
-            message.attach(body)
-            
-            # Add attachments
-            if attachments:
-                for file_path in attachments:
-                    if os.path.exists(file_path):
-                        attachment = self._create_attachment(file_path)
-                        if attachment:
-                            message.attach(attachment)
-            
-            # Encode and send
-            raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            raw = self._build_raw(recipient, subject, html_content, text_content, attachments, bcc)
             
-            self.service.users().messages().send(
+            self._maybe_refresh()
+            _execute_send(self.service.users().messages().send(
                 userId='me',
                 body={'raw': raw}
-            ).execute()
+            ))
             
             logger.info(f"Email sent successfully to {recipient}")
             return True
             
-        except Exception as e:
+        except _SEND_ERRORS as e:
             logger.error(f"Failed to send email: {e}")
             return False
     
+    def send_emails_batch(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Send several emails with batched Gmail API requests.
+        
+        Up to MAX_BATCH_SIZE sends share one HTTP round trip instead of
+        one each. A failed message does not stop the others.
+        
+        Args:
+            messages: Keyword arguments for send_email, one dict per email
+            
+        Returns:
+            Whether each email was sent, in input order
+        """
+        results = [False] * len(messages)
+        retries: Dict[int, HttpError] = {}
+        attempt = 1
+        
+        def on_send(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            index = int(request_id)
+            if exception is None:
+                results[index] = True
+                logger.info(f"Email sent successfully to {messages[index]['recipient']}")
+            elif _is_retryable(exception) and attempt < _SEND_ATTEMPTS:
+                retries[index] = exception
+            else:
+                logger.error(f"Failed to send email to {messages[index]['recipient']}: {exception}")
+        
+        # Build every message up front, so a bad one is skipped before
+        # any request goes out
+        raws = {}
+        for i, kwargs in enumerate(messages):
+            try:
+                raws[i] = self._build_raw(**kwargs)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to build email to {kwargs.get('recipient')}: {e}")
+        
+        self._maybe_refresh()
+        pending = list(raws.items())
+        while pending:
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=on_send)
+                for i, raw in pending[start:start + MAX_BATCH_SIZE]:
+                    batch.add(
+                        self.service.users().messages().send(userId='me', body={'raw': raw}),
+                        request_id=str(i)
+                    )
+                try:
+                    batch.execute()
+                except _SEND_ERRORS as e:
+                    logger.error(f"Failed to send email batch: {e}")
+            
+            if not retries:
+                break
+            
+            # Resend only the rate-limited messages, after the longest wait
+            # any of them asked for
+            delay = max(_retry_delay(error, attempt) for error in retries.values())
+            logger.warning(
+                f"{len(retries)} email(s) rate limited, retrying in {delay:.0f}s "
+                f"({attempt}/{_SEND_ATTEMPTS})..."
+            )
+            time.sleep(delay)
+            pending = [(i, raws[i]) for i in sorted(retries)]
+            retries.clear()
+            attempt += 1
+        
+        return results
+    
+    def _build_raw(
+        self,
+        recipient: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+        attachments: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build an email and encode it for the Gmail API raw field.
+        
+        Emails without attachments (the daily summary unless a CV is
+        attached) are written out directly; the email package is only
+        used when there are attachments or unusual address headers.
+        """
+        addresses = f"{recipient}{self.sender_email or ''}{''.join(bcc or ())}"
+        if attachments or not addresses.isascii() or '\r' in addresses or '\n' in addresses:
+            return self._encode_message(self._build_message(
+                recipient, subject, html_content, text_content, attachments, bcc
+            ))
+        
+        raw = self._build_alternative_bytes(recipient, subject, html_content, text_content, bcc)
+        return _b64.urlsafe_b64encode(raw).decode('ascii')
+    
+    def _build_alternative_bytes(
+        self,
+        recipient: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+        bcc: Optional[List[str]] = None
+    ) -> bytes:
+        """
+        Write a multipart/alternative message without the email package.
+        
+        Headers are fixed, the subject is RFC 2047 encoded and each body
+        part is encoded as MIMEText would with the same charset.
+        """
+        boundary = f"==============={secrets.token_hex(16)}=="
+        lines = [
+            'MIME-Version: 1.0',
+            f'Content-Type: multipart/alternative; boundary="{boundary}"',
+            f"to: {recipient}",
+            f"from: {self.sender_email or 'me'}",
+            f"subject: {Header(subject, 'utf-8').encode()}",
+        ]
+        if bcc:
+            lines.append(f"bcc: {', '.join(bcc)}")
+        lines.append('')
+        
+        bodies = [('plain', text_content)] if text_content else []
+        bodies.append(('html', html_content))
+        for subtype, content in bodies:
+            charset = _body_charset(content)
+            if charset == 'us-ascii':
+                encoding, payload = '7bit', content
+            else:
+                encoding, payload = 'quoted-printable', charset.body_encode(content)
+            lines += [
+                f"--{boundary}",
+                f'Content-Type: text/{subtype}; charset="{charset}"',
+                'MIME-Version: 1.0',
+                f'Content-Transfer-Encoding: {encoding}',
+                '',
+                payload,
+            ]
+        lines.append(f"--{boundary}--\n")
+        
+        return '\n'.join(lines).encode('ascii')
+    
+    def _build_message(
+        self,
+        recipient: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+        attachments: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> MIMEMultipart:
+        """Build the MIME message for an email."""
+        message = MIMEMultipart('mixed')
+        message['to'] = recipient
+        message['from'] = self.sender_email or 'me'
+        message['subject'] = subject
+        if bcc:
+            message['bcc'] = ', '.join(bcc)
+        
+        # Create body part
+        body = MIMEMultipart('alternative')
+        
+        if text_content:
+            body.attach(MIMEText(text_content, 'plain', _body_charset(text_content)))
+        
+        body.attach(MIMEText(html_content, 'html', _body_charset(html_content)))
+        message.attach(body)
+        
+        # Add attachments; files are read and encoded side by side, since
+        # file I/O and base64 encoding release the GIL. Missing files are
+        # skipped by _create_attachment rather than checked up front.
+        paths = list(attachments or ())
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_ATTACHMENT_WORKERS, len(paths))) as executor:
+                parts = list(executor.map(self._create_attachment, paths))
+        else:
+            parts = [self._create_attachment(file_path) for file_path in paths]
+        
+        for attachment in parts:
+            if attachment:
+                message.attach(attachment)
+        
+        return message
+    
+    def _encode_message(self, message: MIMEMultipart) -> str:
+        """Encode a MIME message for the Gmail API raw field."""
+        # Same flattening as message.as_bytes(), streamed into the encoder
+        writer = _Base64Writer()
+        BytesGenerator(writer, mangle_from_=False, policy=message.policy).flatten(message)
+        return writer.getvalue()
+    
     def _create_attachment(self, file_path: str) -> Optional[MIMEBase]:
         """Create an email attachment from file."""
         try:
@@ -210,12 +605,26 @@ class EmailSender:
             
             main_type, sub_type = content_type.split('/', 1)
             
+            # Opening is the existence check; fstat on the open file gives
+            # the cache key without another path lookup
             with open(file_path, 'rb') as f:
-                attachment = MIMEBase(main_type, sub_type)
-                attachment.set_payload(f.read())
+                stat = os.fstat(f.fileno())
+                key = (file_path, stat.st_mtime, stat.st_size)
+                encoded = self._attachment_cache.get(key)
+                if encoded is None:
+                    # Encode here rather than with email.encoders.encode_base64
+                    # so pybase64 is used when available, one chunk at a time
+                    # so the raw file is never held in full; encodebytes wraps
+                    # at 76 characters per line as RFC 2045 requires
+                    encoded = ''.join(
+                        _b64.encodebytes(chunk).decode('ascii')
+                        for chunk in iter(lambda: f.read(_BASE64_CHUNK), b'')
+                    )
+                    self._attachment_cache[key] = encoded
             
-            from email import encoders
-            encoders.encode_base64(attachment)
+            attachment = MIMEBase(main_type, sub_type)
+            attachment.set_payload(encoded)
+            attachment['Content-Transfer-Encoding'] = 'base64'
             
             attachment.add_header(
                 'Content-Disposition',
@@ -225,74 +634,24 @@ class EmailSender:
             
             return attachment
             
-        except Exception as e:
+        except (OSError, ValueError) as e:
             logger.warning(f"Failed to create attachment {file_path}: {e}")
             return None
     
-    def _build_summary_html(self, matched_jobs: List[tuple]) -> str:
+    def _build_summary_html(self, matched_jobs: List[tuple], now: Optional[datetime] = None) -> str:
         """Build compact HTML content for summary email."""
-        jobs_html = ""
-        
-        for i, (job, score) in enumerate(matched_jobs, 1):
-            generated_date = datetime.now().strftime('%Y-%m-%d')
-            job_url = job.application_url or job.url
-            
-            jobs_html += f"""
-            <div style="margin-bottom: 15px; padding: 15px; border: 1px solid #e0e0e0; border-radius: 8px; background-color: #fafafa;">
-                <h3 style="margin: 0 0 10px 0; color: #1a73e8;">
-                    {i}. {job.title}
-                </h3>
-                <table style="width: 100%; font-size: 14px; color: #3c4043;">
-                    <tr><td style="padding: 4px 0;"><strong>Organization:</strong></td><td>{job.organization}</td></tr>
-                    <tr><td style="padding: 4px 0;"><strong>Location:</strong></td><td>{job.location or 'Not specified'}</td></tr>
-                    <tr><td style="padding: 4px 0;"><strong>Generated:</strong></td><td>{generated_date}</td></tr>
-                    <tr><td style="padding: 4px 0;"><strong>Job URL:</strong></td><td><a href="{job_url}" style="color: #1a73e8;">{job_url}</a></td></tr>
-                </table>
-            </div>
-            """
-        
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #202124; max-width: 700px; margin: 0 auto; padding: 20px; }}
-                h2 {{ color: #1a73e8; border-bottom: 2px solid #1a73e8; padding-bottom: 10px; }}
-            </style>
-        </head>
-        <body>
-            <h2>🎯 Job Application Agent - Daily Summary</h2>
-            <p>Found <strong>{len(matched_jobs)}</strong> positions matching your profile. Cover letters have been generated and saved locally.</p>
-            
-            {jobs_html}
-            
-            <hr style="margin: 30px 0; border: none; border-top: 1px solid #e0e0e0;">
-            
-            <p style="color: #5f6368; font-size: 12px;">
-                This email was sent by Job Application Agent.<br>
-                Generated on {datetime.now().strftime('%B %d, %Y at %H:%M')}
-            </p>
-        </body>
-        </html>
-        """
+        now = now or datetime.now()
+        return _TEMPLATES.get_template("summary_email.html.j2").render(
+            jobs=matched_jobs,
+            generated_date=now.strftime('%Y-%m-%d'),
+            generated_at=now.strftime('%B %d, %Y at %H:%M'),
+        )
     
-    def _build_summary_text(self, matched_jobs: List[tuple]) -> str:
+    def _build_summary_text(self, matched_jobs: List[tuple], now: Optional[datetime] = None) -> str:
         """Build plain text content for summary email."""
-        text = f"Job Application Agent - Daily Summary\n"
-        text += f"{datetime.now().strftime('%B %d, %Y')}\n"
-        text += f"Found {len(matched_jobs)} positions matching your profile.\n"
-        text += "Cover letters have been generated and saved locally.\n\n"
-        text += "=" * 50 + "\n\n"
-        
-        generated_date = datetime.now().strftime('%Y-%m-%d')
-        
-        for i, (job, score) in enumerate(matched_jobs, 1):
-            job_url = job.application_url or job.url
-            text += f"{i}. {job.title}\n"
-            text += f"   Organization: {job.organization}\n"
-            text += f"   Location: {job.location or 'Not specified'}\n"
-            text += f"   Generated: {generated_date}\n"
-            text += f"   Job URL: {job_url}\n\n"
-        
-        return text
+        now = now or datetime.now()
+        return _TEMPLATES.get_template("summary_email.txt.j2").render(
+            jobs=matched_jobs,
+            date=now.strftime('%B %d, %Y'),
+            generated_date=now.strftime('%Y-%m-%d'),
+        )
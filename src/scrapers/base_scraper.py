@@ -321,7 +321,7 @@ class BaseScraper(ABC):
             job: Job object with URL
             
         Returns:
-            Updated Job object with full details
+            Job object with full details (a copy, since Job is frozen)
         """
         return job
     
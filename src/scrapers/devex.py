@@ -7,6 +7,7 @@ Note: DevEx may require JavaScript rendering for full functionality.
 
 import logging
 import re
+from dataclasses import replace
 from typing import List, Optional, Any
 from datetime import datetime
 
@@ -122,25 +123,27 @@ class DevExScraper(BaseScraper):
     
     def parse_job_details(self, job: Job) -> Job:
         """Fetch full job details from the job page."""
+        # Job is frozen; collect the fields to update and copy once
+        details = {}
         try:
             soup = self.get_soup(job.url)
             
             # Full description
             desc_elem = soup.select_one(".job-description, #job-description, .description-content")
             if desc_elem:
-                job.description = self.extract_text(desc_elem)
+                details["description"] = self.extract_text(desc_elem)
             
             # Requirements
             req_elem = soup.select_one(".requirements, .qualifications, #requirements")
             if req_elem:
-                job.requirements = self.extract_text(req_elem)
+                details["requirements"] = self.extract_text(req_elem)
             
             # Application URL
             apply_elem = soup.select_one("a.apply-button, a[href*='apply'], .apply-link")
             if apply_elem:
-                job.application_url = self.make_absolute_url(self.extract_attribute(apply_elem, "href"))
+                details["application_url"] = self.make_absolute_url(self.extract_attribute(apply_elem, "href"))
             
         except Exception as e:
             logger.warning(f"Failed to fetch DevEx job details: {e}")
         
-        return job
+        return replace(job, **details) if details else job
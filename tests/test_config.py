@@ -69,6 +69,20 @@ class TestConfigLoader:
 class TestEnvironmentVariables:
     """Test environment variable handling."""
     
+    def test_resolve_env_vars(self):
+        """Test that ${VAR} references are substituted from the environment."""
+        from unittest.mock import patch
+        from src.config import Config
+        
+        config = Config()
+        with patch.dict(os.environ, {'JAA_TEST_USER': 'alice', 'JAA_TEST_HOST': 'example.org'}):
+            assert config._resolve_env_vars("${JAA_TEST_USER}@${JAA_TEST_HOST}") == "alice@example.org"
+            assert config._resolve_env_vars({'a': ["${JAA_TEST_USER}"]}) == {'a': ["alice"]}
+        
+        os.environ.pop('JAA_TEST_MISSING', None)
+        assert config._resolve_env_vars("x${JAA_TEST_MISSING}y") == "xy"
+        assert config._resolve_env_vars(42) == 42
+    
     def test_env_example_exists(self):
         """Test that .env.example file exists."""
         env_example = Path(__file__).parent.parent / ".env.example"
@@ -134,6 +134,100 @@ class TestDatabaseManager:
         
         assert result_id is not None
     
+    def test_add_jobs_batch(self, db_manager):
+        """Test that add_jobs inserts a batch and skips duplicates."""
+        from src.database.db_manager import Job
+        
+        jobs = [
+            Job(
+                job_id=Job.generate_id(f"https://example.com/job/batch-{i}", "Analyst", "Test Org"),
+                url=f"https://example.com/job/batch-{i}",
+                title="Analyst",
+                organization="Test Org",
+                location="Remote",
+                description="Test description",
+                source="test"
+            )
+            for i in range(3)
+        ]
+        
+        assert db_manager.add_jobs(jobs) == 3
+        assert db_manager.add_jobs(jobs + jobs[:1]) == 0
+        assert all(db_manager.job_exists(j.job_id) for j in jobs)
+    
+    def test_existing_ids(self, db_manager):
+        """Test batched lookup of stored job IDs."""
+        from src.database.db_manager import Job
+        
+        jobs = [
+            Job(
+                job_id=Job.generate_id(f"https://example.com/job/{i}", "Economist", "Org"),
+                url=f"https://example.com/job/{i}",
+                title="Economist",
+                organization="Org",
+                location="Remote",
+                description="Research role",
+                source="test",
+            )
+            for i in range(3)
+        ]
+        db_manager.add_jobs(jobs[:2])
+        
+        ids = [j.job_id for j in jobs] + ["missing"] * 1200
+        assert db_manager.existing_ids(ids) == {jobs[0].job_id, jobs[1].job_id}
+        assert db_manager.existing_ids([]) == set()
+    
+    def test_get_latest_cover_letter(self, db_manager):
+        """Test that the most recent cover letter for a job is returned."""
+        assert db_manager.get_latest_cover_letter("job-1") is None
+        
+        db_manager.save_cover_letter("job-1", "First draft", "/tmp/first.md")
+        db_manager.save_cover_letter("job-1", "Second draft", "/tmp/second.md")
+        
+        assert db_manager.get_latest_cover_letter("job-1") == ("Second draft", "/tmp/second.md")
+    
+    def test_match_cache(self, db_manager):
+        """Test that cached match scores expire after their TTL."""
+        assert db_manager.get_cached_match("key-1", max_age_days=7) is None
+        
+        db_manager.cache_match("key-1", '{"overall": 80}')
+        
+        assert db_manager.get_cached_match("key-1", max_age_days=7) == '{"overall": 80}'
+        assert db_manager.get_cached_match("key-1", max_age_days=-1) is None
+    
+    def test_match_embeddings(self, db_manager):
+        """Test embeddings are returned per context and expire after their TTL."""
+        db_manager.save_match_embedding("key-1", "ctx-a", b"\x00\x01")
+        db_manager.save_match_embedding("key-2", "ctx-b", b"\x02\x03")
+        
+        assert db_manager.get_match_embeddings("ctx-a", max_age_days=7) == [("key-1", b"\x00\x01")]
+        assert db_manager.get_match_embeddings("ctx-a", max_age_days=-1) == []
+    
+    def test_bulk_match_writes(self, db_manager):
+        """Test saving match results and marking jobs processed in bulk."""
+        from src.database.db_manager import Job, MatchResult
+        
+        jobs = [
+            Job(
+                job_id=f"bulk-{i}",
+                url=f"https://example.com/job/bulk-{i}",
+                title="Economist",
+                organization="Org",
+                location="Remote",
+                description="Research role",
+                source="test",
+            )
+            for i in range(2)
+        ]
+        db_manager.save_match_results([
+            MatchResult(job.job_id, 80.0, 80.0, 80.0, 80.0, 80.0, "Good fit", "2024-01-01")
+            for job in jobs
+        ])
+        db_manager.mark_jobs_processed([(jobs[0], 80.0, "/tmp/a.md"), (jobs[1], 75.0, None)])
+        
+        assert db_manager.processed_ids([j.job_id for j in jobs]) == {"bulk-0", "bulk-1"}
+        assert db_manager.get_match_result("bulk-1").reasoning == "Good fit"
+    
     def test_get_statistics(self, db_manager):
         """Test getting database statistics."""
         stats = db_manager.get_statistics()
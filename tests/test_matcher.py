@@ -145,5 +145,52 @@ class TestMatchThreshold:
         assert score >= threshold
 
 
+class TestVisaEligibility:
+    """Test visa/citizenship eligibility filtering."""
+    
+    def test_eligible_description(self):
+        """Test description without restrictions."""
+        from src.matching.matcher import check_visa_eligibility
+        
+        assert check_visa_eligibility("Research role in Nairobi") == (True, None)
+        assert check_visa_eligibility("") == (True, None)
+    
+    def test_visa_reason_takes_precedence(self):
+        """Test visa patterns are reported before citizenship patterns."""
+        from src.matching.matcher import check_visa_eligibility
+        
+        eligible, reason = check_visa_eligibility(
+            "Must be a US Citizen. No visa sponsorship offered."
+        )
+        
+        assert not eligible
+        assert reason == "No visa sponsorship: 'no visa sponsorship' found in description"
+    
+    def test_citizenship_required(self):
+        """Test citizenship-only description."""
+        from src.matching.matcher import check_visa_eligibility
+        
+        eligible, reason = check_visa_eligibility("Open to U.S. Citizens only")
+        
+        assert not eligible
+        assert reason.startswith("Citizenship required:")
+    
+    def test_batch_matches_single_checks(self):
+        """Test the batched check agrees with checking one job at a time."""
+        from src.matching.matcher import check_visa_eligibility, check_visa_eligibility_batch
+        
+        descriptions = [
+            "Research role in Nairobi",
+            "",
+            "İstanbul office. US citizens only; no sponsorship available.",
+            "Must be a US Citizen",
+            "Unable to sponsor visas",
+        ]
+        
+        assert check_visa_eligibility_batch(descriptions) == [
+            check_visa_eligibility(desc) for desc in descriptions
+        ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])